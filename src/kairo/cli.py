@@ -6,12 +6,22 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from .database import Database
+from .database import StatusChange, get_db
 from .models import TaskStatus
-from .utils import format_week, get_current_week, get_next_week, parse_week
+from .utils import (
+    format_week,
+    get_current_week,
+    get_next_week,
+    parse_tags,
+    parse_week,
+)
 
 console = Console()
 
+# Status cells for task tables, built once so Rich skips markup parsing per row
+_STATUS_DONE = Text("✓ Done", style="green")
+_STATUS_OPEN = Text("○ Open", style="yellow")
+
 
 @click.group(invoke_without_command=True)
 @click.pass_context
@@ -37,7 +47,7 @@ def cli(ctx):
 @click.option("-t", "--tags", help="Comma-separated list of tags (e.g., work,urgent)")
 def add(title: str, description: str, week: str, tags: str):
     """Add a new task."""
-    db = Database()
+    db = get_db()
 
     try:
         if week:
@@ -46,9 +56,7 @@ def add(title: str, description: str, week: str, tags: str):
             year, week_num = get_current_week()
 
         # Parse tags
-        tag_list = []
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        tag_list = parse_tags(tags) if tags else []
 
         task = db.add_task(
             title=title,
@@ -70,8 +78,6 @@ def add(title: str, description: str, week: str, tags: str):
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
         raise click.Abort()
-    finally:
-        db.close()
 
 
 @cli.command()
@@ -83,7 +89,7 @@ def add(title: str, description: str, week: str, tags: str):
 @click.option("-t", "--tag", help="Filter by tag")
 def list(week: str, show_all: bool, status: str, tag: str):
     """List tasks."""
-    db = Database()
+    db = get_db()
 
     try:
         if week:
@@ -139,16 +145,11 @@ def list(week: str, show_all: bool, status: str, tag: str):
         table.add_column("Description", style="dim")
 
         for task in tasks:
-            status_display = (
-                "✓ Done" if task.status == TaskStatus.COMPLETED else "○ Open"
-            )
-            status_style = "green" if task.status == TaskStatus.COMPLETED else "yellow"
-
             tags_display = ", ".join(task.tags) if task.tags else "-"
 
             table.add_row(
                 str(task.id),
-                f"[{status_style}]{status_display}[/{status_style}]",
+                _STATUS_DONE if task.status is TaskStatus.COMPLETED else _STATUS_OPEN,
                 task.title,
                 format_week(task.year, task.week),
                 tags_display,
@@ -161,68 +162,42 @@ def list(week: str, show_all: bool, status: str, tag: str):
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
         raise click.Abort()
-    finally:
-        db.close()
 
 
 @cli.command()
 @click.argument("task_id", type=int)
 def complete(task_id: int):
     """Mark a task as completed."""
-    db = Database()
-
-    try:
-        task = db.get_task(task_id)
-        if not task:
-            console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
-            raise click.Abort()
+    db = get_db()
 
-        if task.status == TaskStatus.COMPLETED:
-            console.print(f"[yellow]Task {task_id} is already completed.[/yellow]")
-            return
+    outcome, title = db.complete_task(task_id)
+    if outcome is StatusChange.NOT_FOUND:
+        console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
+        raise click.Abort()
 
-        if db.complete_task(task_id):
-            console.print(
-                f"\n[green]✓[/green] Task completed: [bold]{task.title}[/bold]\n"
-            )
-        else:
-            console.print(
-                f"[red]Error:[/red] Failed to complete task {task_id}.", err=True
-            )
-            raise click.Abort()
+    if outcome is StatusChange.UNCHANGED:
+        console.print(f"[yellow]Task {task_id} is already completed.[/yellow]")
+        return
 
-    finally:
-        db.close()
+    console.print(f"\n[green]✓[/green] Task completed: [bold]{title}[/bold]\n")
 
 
 @cli.command()
 @click.argument("task_id", type=int)
 def reopen(task_id: int):
     """Mark a completed task as open again."""
-    db = Database()
-
-    try:
-        task = db.get_task(task_id)
-        if not task:
-            console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
-            raise click.Abort()
+    db = get_db()
 
-        if task.status == TaskStatus.OPEN:
-            console.print(f"[yellow]Task {task_id} is already open.[/yellow]")
-            return
+    outcome, title = db.reopen_task(task_id)
+    if outcome is StatusChange.NOT_FOUND:
+        console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
+        raise click.Abort()
 
-        if db.reopen_task(task_id):
-            console.print(
-                f"\n[yellow]○[/yellow] Task reopened: [bold]{task.title}[/bold]\n"
-            )
-        else:
-            console.print(
-                f"[red]Error:[/red] Failed to reopen task {task_id}.", err=True
-            )
-            raise click.Abort()
+    if outcome is StatusChange.UNCHANGED:
+        console.print(f"[yellow]Task {task_id} is already open.[/yellow]")
+        return
 
-    finally:
-        db.close()
+    console.print(f"\n[yellow]○[/yellow] Task reopened: [bold]{title}[/bold]\n")
 
 
 @cli.command()
@@ -230,26 +205,14 @@ def reopen(task_id: int):
 @click.confirmation_option(prompt="Are you sure you want to delete this task?")
 def delete(task_id: int):
     """Delete a task permanently."""
-    db = Database()
-
-    try:
-        task = db.get_task(task_id)
-        if not task:
-            console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
-            raise click.Abort()
+    db = get_db()
 
-        task_title = task.title
-
-        if db.delete_task(task_id):
-            console.print(f"\n[red]✗[/red] Task deleted: [bold]{task_title}[/bold]\n")
-        else:
-            console.print(
-                f"[red]Error:[/red] Failed to delete task {task_id}.", err=True
-            )
-            raise click.Abort()
+    task_title = db.delete_task(task_id)
+    if task_title is None:
+        console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
+        raise click.Abort()
 
-    finally:
-        db.close()
+    console.print(f"\n[red]✗[/red] Task deleted: [bold]{task_title}[/bold]\n")
 
 
 @cli.command()
@@ -259,48 +222,42 @@ def delete(task_id: int):
 @click.option("-t", "--tags", help="New comma-separated list of tags")
 def edit(task_id: int, title: str, description: str, tags: str):
     """Edit a task's title, description, or tags."""
-    db = Database()
-
-    try:
-        task = db.get_task(task_id)
-        if not task:
-            console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
-            raise click.Abort()
-
-        if not title and not description and tags is None:
-            console.print(
-                "[yellow]No changes specified. Use --title, -d/--description, or -t/--tags.[/yellow]"
-            )
-            return
-
-        # Parse tags if provided
-        tag_list = None
-        if tags is not None:
-            tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+    db = get_db()
 
-        if db.update_task(
-            task_id,
-            title=title if title else None,
-            description=description if description else None,
-            tags=tag_list,
-        ):
-            console.print(f"\n[green]✓[/green] Task updated: [bold]{task.title}[/bold]")
-
-            if title:
-                console.print(f"  Title: {title}")
-            if description:
-                console.print(f"  Description: {description}")
-            if tag_list is not None:
-                console.print(f"  Tags: {', '.join(tag_list) if tag_list else 'None'}")
-            console.print()
-        else:
-            console.print(
-                f"[red]Error:[/red] Failed to update task {task_id}.", err=True
-            )
-            raise click.Abort()
+    task = db.get_task(task_id)
+    if not task:
+        console.print(f"[red]Error:[/red] Task {task_id} not found.", err=True)
+        raise click.Abort()
 
-    finally:
-        db.close()
+    if not title and not description and tags is None:
+        console.print(
+            "[yellow]No changes specified. Use --title, -d/--description, or -t/--tags.[/yellow]"
+        )
+        return
+
+    # Parse tags if provided
+    tag_list = None
+    if tags is not None:
+        tag_list = parse_tags(tags)
+
+    if db.update_task(
+        task_id,
+        title=title if title else None,
+        description=description if description else None,
+        tags=tag_list,
+    ):
+        console.print(f"\n[green]✓[/green] Task updated: [bold]{task.title}[/bold]")
+
+        if title:
+            console.print(f"  Title: {title}")
+        if description:
+            console.print(f"  Description: {description}")
+        if tag_list is not None:
+            console.print(f"  Tags: {', '.join(tag_list) if tag_list else 'None'}")
+        console.print()
+    else:
+        console.print(f"[red]Error:[/red] Failed to update task {task_id}.", err=True)
+        raise click.Abort()
 
 
 @cli.command()
@@ -309,7 +266,7 @@ def edit(task_id: int, title: str, description: str, tags: str):
 )
 def plan(week: str):
     """Show weekly planning report."""
-    db = Database()
+    db = get_db()
 
     try:
         if week:
@@ -317,17 +274,17 @@ def plan(week: str):
         else:
             year, week_num = get_current_week()
 
-        tasks = db.list_tasks(week=week_num, year=year, status=TaskStatus.OPEN)
-        stats = db.get_week_stats(year, week_num)
+        all_tasks, stats = db.list_tasks_with_stats(year, week_num)
+        tasks = [t for t in all_tasks if t.status == TaskStatus.OPEN]
 
         # Header
         week_str = format_week(year, week_num)
         console.print(f"\n[bold cyan]Weekly Plan - {week_str}[/bold cyan]\n")
 
         # Stats
-        console.print(f"Total tasks planned: {stats['total']}")
-        console.print(f"Open tasks: {stats['open']}")
-        console.print(f"Completed tasks: {stats['completed']}\n")
+        console.print(f"Total tasks planned: {stats.total}")
+        console.print(f"Open tasks: {stats.open}")
+        console.print(f"Completed tasks: {stats.completed}\n")
 
         if not tasks:
             console.print("[yellow]No open tasks for this week.[/yellow]\n")
@@ -352,8 +309,6 @@ def plan(week: str):
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
         raise click.Abort()
-    finally:
-        db.close()
 
 
 @cli.command()
@@ -362,7 +317,7 @@ def plan(week: str):
 )
 def report(week: str):
     """Show weekly completion report."""
-    db = Database()
+    db = get_db()
 
     try:
         if week:
@@ -370,8 +325,7 @@ def report(week: str):
         else:
             year, week_num = get_current_week()
 
-        stats = db.get_week_stats(year, week_num)
-        all_tasks = db.list_tasks(week=week_num, year=year)
+        all_tasks, stats = db.list_tasks_with_stats(year, week_num)
 
         # Header
         week_str = format_week(year, week_num)
@@ -379,14 +333,14 @@ def report(week: str):
 
         # Calculate completion rate
         completion_rate = 0
-        if stats["total"] > 0:
-            completion_rate = (stats["completed"] / stats["total"]) * 100
+        if stats.total > 0:
+            completion_rate = (stats.completed / stats.total) * 100
 
         # Stats panel
         stats_text = Text()
-        stats_text.append(f"Total tasks: {stats['total']}\n")
-        stats_text.append(f"Completed: {stats['completed']}\n", style="green")
-        stats_text.append(f"Open: {stats['open']}\n", style="yellow")
+        stats_text.append(f"Total tasks: {stats.total}\n")
+        stats_text.append(f"Completed: {stats.completed}\n", style="green")
+        stats_text.append(f"Open: {stats.open}\n", style="yellow")
         stats_text.append(f"Completion rate: {completion_rate:.1f}%\n", style="bold")
 
         console.print(Panel(stats_text, title="Statistics", border_style="cyan"))
@@ -396,9 +350,13 @@ def report(week: str):
             console.print("[yellow]No tasks for this week.[/yellow]\n")
             return
 
-        # Split tasks by status
-        completed_tasks = [t for t in all_tasks if t.status == TaskStatus.COMPLETED]
-        open_tasks = [t for t in all_tasks if t.status == TaskStatus.OPEN]
+        # Split tasks by status in a single pass
+        completed_tasks, open_tasks = [], []
+        for t in all_tasks:
+            if t.status is TaskStatus.COMPLETED:
+                completed_tasks.append(t)
+            else:
+                open_tasks.append(t)
 
         # Completed tasks
         if completed_tasks:
@@ -417,8 +375,6 @@ def report(week: str):
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
         raise click.Abort()
-    finally:
-        db.close()
 
 
 @cli.command()
@@ -427,7 +383,7 @@ def report(week: str):
 @click.confirmation_option(prompt="Are you sure you want to rollover incomplete tasks?")
 def rollover(from_week: str, to_week: str):
     """Move incomplete tasks to next week."""
-    db = Database()
+    db = get_db()
 
     try:
         # Parse source week
@@ -443,7 +399,8 @@ def rollover(from_week: str, to_week: str):
             to_year, to_week_num = get_next_week(from_year, from_week_num)
 
         # Perform rollover
-        count = db.rollover_tasks(from_year, from_week_num, to_year, to_week_num)
+        moved = db.rollover_tasks(from_year, from_week_num, to_year, to_week_num)
+        count = len(moved)
 
         from_str = format_week(from_year, from_week_num)
         to_str = format_week(to_year, to_week_num)
@@ -460,8 +417,6 @@ def rollover(from_week: str, to_week: str):
     except ValueError as e:
         console.print(f"[red]Error:[/red] {e}", err=True)
         raise click.Abort()
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -1,204 +1,601 @@
 """Database layer for task storage using SQLite."""
 
+import atexit
 import sqlite3
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from .models import Task, TaskStatus
+from .models import _STATUS_BY_VALUE, Task, TaskStatus, WeekStats
 from .utils import get_current_week
 
 # Sentinel value to distinguish between "don't update" and "set to None"
 _UNSET = object()
 
+# Bound once at import; _row_to_task calls these for every row it converts
+_fromtimestamp = datetime.fromtimestamp
+_intern = sys.intern
+
+# Stored status values, resolved once instead of through the enum per call
+_STATUS_OPEN = TaskStatus.OPEN.value
+_STATUS_COMPLETED = TaskStatus.COMPLETED.value
+
+# Max IDs bound per IN (...) query, kept below SQLite's 999 variable limit
+_MAX_IN_PARAMS = 900
+
+# Max moves per rollover_many() call: four parameters each, in one statement
+_MAX_ROLLOVER_MOVES = _MAX_IN_PARAMS // 4
+
+# Rows pulled per fetchmany() call when streaming task listings
+_FETCH_BATCH_SIZE = 256
+
+# Size of the per-connection prepared statement cache
+_CACHED_STATEMENTS = 256
+
+# Stored in PRAGMA user_version once _create_tables has brought a database up
+# to date. Bump it whenever a table, column, index or migration is added.
+# Released databases are at 0; once a bump ships, later changes bump it again.
+_SCHEMA_VERSION = 1
+
+# Oldest SQLite library the queries run on: they use RETURNING (3.35) and
+# UPDATE ... FROM (3.33)
+_MIN_SQLITE_VERSION = (3, 35, 0)
+
+# Seconds to wait on a lock held by another connection (e.g. the TUI while a
+# CLI command writes) before raising "database is locked"
+_BUSY_TIMEOUT = 5.0
+
+# SQL statements are kept as module constants so every call reuses the same
+# text and hits the connection's prepared statement cache.
+_SQL_MAX_POSITION = "SELECT MAX(position) FROM tasks WHERE week = ? AND year = ?"
+_SQL_MAX_INBOX_POSITION = (
+    "SELECT MAX(position) FROM tasks WHERE week IS NULL AND year IS NULL"
+)
+_SQL_INSERT_TASK = """
+    INSERT INTO tasks (title, description, status, week, year, created_at, estimate, project, position)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Inserts an open task at the end of its week (or the inbox) in one statement.
+# "IS" compares NULL week/year as equal, so inbox tasks get their own numbering.
+_SQL_APPEND_TASK = f"""
+    INSERT INTO tasks (title, description, status, week, year, created_at, estimate, project, position)
+    SELECT ?, ?, '{_STATUS_OPEN}', ?, ?, ?, ?, ?, COALESCE(MAX(position), 0) + 1
+    FROM tasks
+    WHERE year IS ? AND week IS ?
+    RETURNING id, position
+"""
+_SQL_LAST_INSERT_ROWID = "SELECT last_insert_rowid()"
+# Separator for the tag names aggregated into one column (ASCII unit separator)
+_TAG_SEPARATOR = "\x1f"
+
+# Column order must match the tuple unpacking in Database._row_to_task. The
+# last column gathers each task's tag names, sorted, so listings need no
+# separate tag queries.
+_TASK_COLUMNS = (
+    "id, title, description, status, week, year,"
+    " created_at, completed_at, estimate, project, position,"
+    " (SELECT group_concat(name, char(31)) FROM ("
+    "SELECT tags.name FROM task_tags JOIN tags ON tags.id = task_tags.tag_id"
+    " WHERE task_tags.task_id = tasks.id ORDER BY tags.name))"
+)
+_SQL_GET_TASK = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+_SQL_GET_TASK_TITLE = "SELECT title FROM tasks WHERE id = ?"
+_SQL_COMPLETE_TASK = f"""
+    UPDATE tasks
+    SET status = '{_STATUS_COMPLETED}', completed_at = ?
+    WHERE id = ? AND status = '{_STATUS_OPEN}'
+    RETURNING title
+"""
+_SQL_REOPEN_TASK = f"""
+    UPDATE tasks
+    SET status = '{_STATUS_OPEN}', completed_at = NULL
+    WHERE id = ? AND status = '{_STATUS_COMPLETED}'
+    RETURNING title
+"""
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ? RETURNING title"
+# Each row takes the position of the other one. The joined row is read
+# before either is written, and a missing id leaves nothing to update.
+_SQL_SWAP_TASK_POSITIONS = """
+    UPDATE tasks SET position = other.position
+    FROM tasks AS other
+    WHERE tasks.id IN (?, ?)
+      AND other.id = CASE tasks.id WHEN ? THEN ? ELSE ? END
+"""
+# Rollover only ever moves open tasks, so the status is a literal the planner
+# can resolve against idx_tasks_year_week_status_estimate at prepare time.
+# Takes one (from_year, from_week, to_year, to_week) row per move.
+_SQL_MOVE_OPEN_TASKS = f"""
+    WITH moves (from_year, from_week, to_year, to_week) AS (VALUES {{values}})
+    UPDATE tasks
+    SET week = moves.to_week, year = moves.to_year
+    FROM moves
+    WHERE tasks.year = moves.from_year AND tasks.week = moves.from_week
+      AND tasks.status = '{_STATUS_OPEN}'
+    RETURNING tasks.id, tasks.title
+"""
+_SQL_WEEK_STATS = """
+    SELECT status, COUNT(*) as count, SUM(estimate) as estimate
+    FROM tasks
+    WHERE year = ? AND week = ?
+    GROUP BY status
+"""
+# Multi-row tag UPSERT; the no-op DO UPDATE makes RETURNING yield the id
+# of existing tags as well as newly created ones. Formatted statements are
+# kept in _SQL_UPSERT_TAGS_BY_COUNT, keyed by the number of tags.
+_SQL_UPSERT_TAGS = """
+    INSERT INTO tags (name) VALUES {values}
+    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+_SQL_CREATE_TASK_TAGS = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        task_id INTEGER NOT NULL,
+        tag_id INTEGER NOT NULL,
+        PRIMARY KEY (task_id, tag_id),
+        FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+        FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+"""
+_SQL_UPSERT_TAGS_BY_COUNT: dict[int, str] = {}
+_SQL_INSERT_TASK_TAG = "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)"
+_SQL_DELETE_TASK_TAGS = "DELETE FROM task_tags WHERE task_id = ?"
+_SQL_GET_ALL_TAGS = "SELECT name FROM tags ORDER BY name"
+# Columns update_task can assign, in parameter order
+_UPDATE_COLUMNS = (
+    "title",
+    "description",
+    "estimate",
+    "project",
+    "position",
+    "week",
+    "year",
+)
+# UPDATE statements keyed by the columns they assign, built on first use
+_SQL_UPDATE_TASK: dict[tuple[str, ...], str] = {}
+_SQL_TASK_EXISTS = "SELECT 1 FROM tasks WHERE id = ?"
+_SQL_GET_ALL_PROJECTS = (
+    "SELECT DISTINCT project FROM tasks WHERE project IS NOT NULL ORDER BY project"
+)
+
+
+def _filter_variants(
+    base: str, week_filter: str, status_filter: str, order_by: str
+) -> dict[tuple[bool, bool], str]:
+    """Pre-build a list query for every week/status filter combination.
+
+    Args:
+        base: SELECT ... WHERE clause shared by all variants
+        week_filter: Clause appended when filtering by week
+        status_filter: Clause appended when filtering by status
+        order_by: ORDER BY clause
+
+    Returns:
+        Dictionary mapping (filter_by_week, filter_by_status) to SQL text
+    """
+    return {
+        (by_week, by_status): base
+        + (week_filter if by_week else "")
+        + (status_filter if by_status else "")
+        + order_by
+        for by_week in (True, False)
+        for by_status in (True, False)
+    }
+
+
+_SQL_LIST_TASKS = _filter_variants(
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE week IS NOT NULL AND year IS NOT NULL",
+    " AND week = ? AND year = ?",
+    " AND status = ?",
+    " ORDER BY position ASC, id ASC",
+)
+_SQL_LIST_TASKS_BY_TAG = _filter_variants(
+    f"""
+    SELECT {_TASK_COLUMNS} FROM tasks
+    WHERE EXISTS (
+        SELECT 1 FROM task_tags
+        JOIN tags ON tags.id = task_tags.tag_id
+        WHERE task_tags.task_id = tasks.id AND tags.name = ?
+    )""",
+    " AND tasks.week = ? AND tasks.year = ?",
+    " AND tasks.status = ?",
+    " ORDER BY tasks.position ASC, tasks.id ASC",
+)
+_SQL_LIST_TASKS_BY_PROJECT = _filter_variants(
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE project = ?",
+    " AND week = ? AND year = ?",
+    " AND status = ?",
+    " ORDER BY position ASC, id ASC",
+)
+# Inbox tasks have no week, so only the status filter varies
+_SQL_LIST_INBOX_TASKS = {
+    by_status: f"SELECT {_TASK_COLUMNS} FROM tasks WHERE week IS NULL AND year IS NULL"
+    + (" AND status = ?" if by_status else "")
+    + " ORDER BY position ASC, id ASC"
+    for by_status in (True, False)
+}
+
+
+def task_stats(tasks: list[Task]) -> WeekStats:
+    """Compute week statistics from already-loaded tasks.
+
+    Args:
+        tasks: Tasks to summarize
+
+    Returns:
+        Statistics in the same form as Database.get_week_stats()
+    """
+    completed = completed_estimate = open_estimate = 0
+
+    for task in tasks:
+        if task.status == TaskStatus.COMPLETED:
+            completed += 1
+            completed_estimate += task.estimate or 0
+        else:
+            open_estimate += task.estimate or 0
+
+    return WeekStats(
+        total=len(tasks),
+        completed=completed,
+        open=len(tasks) - completed,
+        total_estimate=completed_estimate + open_estimate,
+        completed_estimate=completed_estimate,
+        open_estimate=open_estimate,
+    )
+
+
+class StatusChange(Enum):
+    """Outcome of a complete/reopen request on a single task."""
+
+    NOT_FOUND = "not_found"
+    UNCHANGED = "unchanged"
+    CHANGED = "changed"
+
 
 class Database:
     """SQLite database for task management."""
 
+    # Database files whose schema has already been created/migrated in this process
+    _initialized_paths: set[Path] = set()
+    # Keeps threads opening the same file from running the migrations twice
+    _initialized_paths_lock = threading.Lock()
+
     def __init__(self, db_path: Path | None = None):
         """Initialize database connection.
 
         Args:
-            db_path: Path to database file. If None, uses ~/.kairo/tasks.db
+            db_path: Path to database file. If None, uses ~/.kairo/tasks.db.
+                Path(":memory:") opens a private in-memory database.
+
+        Raises:
+            RuntimeError: If the SQLite library is older than 3.35.
         """
+        if sqlite3.sqlite_version_info < _MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"kairo needs SQLite {'.'.join(map(str, _MIN_SQLITE_VERSION))} "
+                f"or newer; Python is linked against {sqlite3.sqlite_version}"
+            )
+
         if db_path is None:
             db_path = Path.home() / ".kairo" / "tasks.db"
 
+        # Every ":memory:" connection is a separate, empty database
+        self.in_memory = str(db_path) == ":memory:"
+
         # Create directory if it doesn't exist
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.in_memory:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = db_path
-        self.conn = sqlite3.connect(str(db_path))
+        self._transaction_depth = 0
+        self.conn = sqlite3.connect(
+            str(db_path),
+            timeout=_BUSY_TIMEOUT,
+            cached_statements=_CACHED_STATEMENTS,
+        )
         self.conn.row_factory = sqlite3.Row
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create database tables if they don't exist."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT NOT NULL DEFAULT '',
-                status TEXT NOT NULL DEFAULT 'open',
-                week INTEGER,
-                year INTEGER,
-                created_at TEXT NOT NULL,
-                completed_at TEXT,
-                estimate INTEGER,
-                project TEXT
-            )
+        self._configure_connection()
+        if self.in_memory:
+            self._create_tables()
+        else:
+            with Database._initialized_paths_lock:
+                if db_path not in Database._initialized_paths:
+                    self._create_tables()
+                    Database._initialized_paths.add(db_path)
+
+        # Enforce ON DELETE CASCADE for task_tags. Enabled after the migrations
+        # so table rebuilds in _create_tables don't cascade-delete tag links.
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run a block of writes as a single transaction with one commit.
+
+        Every write method runs inside this, so a single call still commits
+        on its own. Nested use joins the outermost transaction, letting
+        callers batch several writes into one commit. Any exception rolls the
+        whole transaction back.
         """
-        )
-
-        # Create tags table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tags (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE
-            )
+        outermost = self._transaction_depth == 0
+        self._transaction_depth += 1
+        try:
+            if outermost:
+                # Take the write lock up front. A deferred transaction that
+                # reads before it writes gets SQLITE_BUSY straight away, without
+                # waiting out the busy timeout, if another connection wrote in
+                # between; reads inside the block also see a stable snapshot.
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN IMMEDIATE")
+                with self.conn:
+                    yield
+            else:
+                yield
+        finally:
+            self._transaction_depth -= 1
+
+    def _configure_connection(self):
+        """Apply SQLite performance pragmas to the connection.
+
+        WAL mode is persisted in the database file; the other pragmas only
+        last for the lifetime of this connection.
         """
-        )
+        cursor = self.conn.cursor()
 
-        # Create task_tags junction table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS task_tags (
-                task_id INTEGER NOT NULL,
-                tag_id INTEGER NOT NULL,
-                PRIMARY KEY (task_id, tag_id),
-                FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
-                FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
-            )
-        """
-        )
+        # In-memory databases have no journal file to switch to WAL
+        if not self.in_memory:
+            cursor.execute("PRAGMA journal_mode")
+            if cursor.fetchone()[0] != "wal":
+                cursor.execute("PRAGMA journal_mode=WAL")
 
-        # Migration: Add estimate column if it doesn't exist
-        try:
-            cursor.execute("SELECT estimate FROM tasks LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("ALTER TABLE tasks ADD COLUMN estimate INTEGER")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # Upper bounds only: pages are cached and mapped as the file grows
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        if not self.in_memory:
+            cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped IO
 
-        # Migration: Add project column if it doesn't exist
-        try:
-            cursor.execute("SELECT project FROM tasks LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("ALTER TABLE tasks ADD COLUMN project TEXT")
+    def _create_tables(self):
+        """Create database tables if they don't exist."""
+        cursor = self.conn.cursor()
 
-        # Migration: Add position column if it doesn't exist
-        # Position is used for manual task ordering (lower = higher in list)
-        try:
-            cursor.execute("SELECT position FROM tasks LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("ALTER TABLE tasks ADD COLUMN position INTEGER DEFAULT 0")
-
-        # Migration: Make week and year nullable (for inbox feature)
-        # Check if week/year have NOT NULL constraint by trying to insert NULL
-        cursor.execute("PRAGMA table_info(tasks)")
-        columns = {row[1]: row for row in cursor.fetchall()}
-
-        # If week column has notnull=1, we need to recreate the table
-        if (
-            columns.get("week") and columns["week"][3] == 1
-        ):  # notnull column is at index 3
-            # Recreate table without NOT NULL constraints on week/year
+        # Databases already at the current schema skip the checks below
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] == _SCHEMA_VERSION:
+            return
+
+        # Run the whole setup as one transaction: one commit instead of one
+        # per DDL statement, and the write lock keeps a second process from
+        # migrating the same file concurrently
+        with self.transaction():
             cursor.execute(
                 """
-                CREATE TABLE tasks_new (
+                CREATE TABLE IF NOT EXISTS tasks (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
                     description TEXT NOT NULL DEFAULT '',
                     status TEXT NOT NULL DEFAULT 'open',
                     week INTEGER,
                     year INTEGER,
-                    created_at TEXT NOT NULL,
-                    completed_at TEXT,
+                    created_at INTEGER NOT NULL,
+                    completed_at INTEGER,
                     estimate INTEGER,
-                    project TEXT,
-                    position INTEGER DEFAULT 0
+                    project TEXT
                 )
             """
             )
 
-            # Copy data
+            # Create tags table
             cursor.execute(
                 """
-                INSERT INTO tasks_new (id, title, description, status, week, year, created_at, completed_at, estimate, project, position)
-                SELECT id, title, description, status, week, year, created_at, completed_at, estimate, project, 0
-                FROM tasks
+                CREATE TABLE IF NOT EXISTS tags (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE
+                )
             """
             )
 
-            # Drop old table and rename new one
-            cursor.execute("DROP TABLE tasks")
-            cursor.execute("ALTER TABLE tasks_new RENAME TO tasks")
+            # Create task_tags junction table; the primary key covers both
+            # columns, so the rows live in the key's B-tree with no rowid
+            cursor.execute(_SQL_CREATE_TASK_TAGS.format(name="task_tags"))
 
-        # One-time migration: Assign positions to existing tasks based on created_at
-        # Use a marker table to track if this migration has run
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS migrations (
-                name TEXT PRIMARY KEY,
-                applied_at TEXT NOT NULL
-            )
-        """
-        )
+            # Existing columns of the tasks table, keyed by name
+            cursor.execute("PRAGMA table_info(tasks)")
+            columns = {row[1]: row for row in cursor.fetchall()}
+
+            # Migration: Add estimate column if it doesn't exist
+            if "estimate" not in columns:
+                cursor.execute("ALTER TABLE tasks ADD COLUMN estimate INTEGER")
+
+            # Migration: Add project column if it doesn't exist
+            if "project" not in columns:
+                cursor.execute("ALTER TABLE tasks ADD COLUMN project TEXT")
+
+            # Migration: Add position column if it doesn't exist
+            # Position is used for manual task ordering (lower = higher in list)
+            if "position" not in columns:
+                cursor.execute(
+                    "ALTER TABLE tasks ADD COLUMN position INTEGER DEFAULT 0"
+                )
+
+            # Migration: Make week and year nullable (for inbox feature)
+            # If week column has notnull=1, we need to recreate the table
+            if (
+                columns.get("week") and columns["week"][3] == 1
+            ):  # notnull column is at index 3
+                # Recreate table without NOT NULL constraints on week/year
+                cursor.execute(
+                    """
+                    CREATE TABLE tasks_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        description TEXT NOT NULL DEFAULT '',
+                        status TEXT NOT NULL DEFAULT 'open',
+                        week INTEGER,
+                        year INTEGER,
+                        created_at TEXT NOT NULL,
+                        completed_at TEXT,
+                        estimate INTEGER,
+                        project TEXT,
+                        position INTEGER DEFAULT 0
+                    )
+                """
+                )
+
+                # Copy data
+                cursor.execute(
+                    """
+                    INSERT INTO tasks_new (id, title, description, status, week, year, created_at, completed_at, estimate, project, position)
+                    SELECT id, title, description, status, week, year, created_at, completed_at, estimate, project, 0
+                    FROM tasks
+                """
+                )
 
-        cursor.execute("SELECT name FROM migrations WHERE name = 'assign_positions'")
-        migration_done = cursor.fetchone()
+                # Drop old table and rename new one
+                cursor.execute("DROP TABLE tasks")
+                cursor.execute("ALTER TABLE tasks_new RENAME TO tasks")
 
-        if not migration_done:
-            # Get all unique week/year combinations (including NULL for inbox)
+            # One-time migration: Assign positions to existing tasks based on created_at
+            # Use a marker table to track if this migration has run
             cursor.execute(
                 """
-                SELECT DISTINCT week, year
-                FROM tasks
-                ORDER BY year, week
+                CREATE TABLE IF NOT EXISTS migrations (
+                    name TEXT PRIMARY KEY,
+                    applied_at TEXT NOT NULL
+                )
             """
             )
-            week_year_groups = cursor.fetchall()
-
-            for group in week_year_groups:
-                week = group[0]
-                year = group[1]
-
-                # Get ALL tasks for this week/year ordered by created_at
-                if week is not None and year is not None:
-                    cursor.execute(
-                        """
-                        SELECT id FROM tasks
-                        WHERE week = ? AND year = ?
-                        ORDER BY created_at ASC
-                    """,
-                        (week, year),
-                    )
-                else:
-                    # Handle inbox tasks (NULL week/year)
-                    cursor.execute(
-                        """
-                        SELECT id FROM tasks
-                        WHERE week IS NULL AND year IS NULL
-                        ORDER BY created_at ASC
+
+            cursor.execute(
+                "SELECT name FROM migrations WHERE name = 'assign_positions'"
+            )
+            migration_done = cursor.fetchone()
+
+            if not migration_done:
+                # Number ALL tasks within each week/year group by created_at, in one
+                # statement (window partitions treat the inbox's NULL week/year as
+                # one group). Overwrites existing positions.
+                cursor.execute(
                     """
-                    )
+                    UPDATE tasks
+                    SET position = numbered.rn
+                    FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY week, year ORDER BY created_at ASC
+                        ) AS rn
+                        FROM tasks
+                    ) AS numbered
+                    WHERE tasks.id = numbered.id
+                """
+                )
 
-                task_ids = [row[0] for row in cursor.fetchall()]
+                # Mark migration as done
+                cursor.execute(
+                    "INSERT INTO migrations (name, applied_at) VALUES ('assign_positions', ?)",
+                    (datetime.now().isoformat(),),
+                )
+
+            # Migration: Store created_at/completed_at as integer Unix timestamps
+            # TEXT column affinity would convert stored integers back to strings,
+            # so legacy tables are recreated with INTEGER columns. The 'utc'
+            # modifier reads the naive ISO strings as local time, matching
+            # datetime.timestamp().
+            cursor.execute("PRAGMA table_info(tasks)")
+            columns = {row[1]: row for row in cursor.fetchall()}
 
-                # Reassign sequential positions starting from 1 (overwrites existing positions)
-                for idx, task_id in enumerate(task_ids, start=1):
-                    cursor.execute(
-                        "UPDATE tasks SET position = ? WHERE id = ?", (idx, task_id)
+            if columns["created_at"][2] == "TEXT":  # declared type is at index 2
+                cursor.execute(
+                    """
+                    CREATE TABLE tasks_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        description TEXT NOT NULL DEFAULT '',
+                        status TEXT NOT NULL DEFAULT 'open',
+                        week INTEGER,
+                        year INTEGER,
+                        created_at INTEGER NOT NULL,
+                        completed_at INTEGER,
+                        estimate INTEGER,
+                        project TEXT,
+                        position INTEGER DEFAULT 0
                     )
+                """
+                )
+
+                cursor.execute(
+                    """
+                    INSERT INTO tasks_new (id, title, description, status, week, year, created_at, completed_at, estimate, project, position)
+                    SELECT id, title, description, status, week, year,
+                        CAST(strftime('%s', created_at, 'utc') AS INTEGER),
+                        CAST(strftime('%s', completed_at, 'utc') AS INTEGER),
+                        estimate, project, position
+                    FROM tasks
+                """
+                )
+
+                cursor.execute("DROP TABLE tasks")
+                cursor.execute("ALTER TABLE tasks_new RENAME TO tasks")
+
+            # Migration: Recreate task_tags as a WITHOUT ROWID table
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'task_tags'")
+            if "WITHOUT ROWID" not in cursor.fetchone()[0].upper():
+                cursor.execute(_SQL_CREATE_TASK_TAGS.format(name="task_tags_new"))
+                cursor.execute(
+                    "INSERT INTO task_tags_new (task_id, tag_id) "
+                    "SELECT task_id, tag_id FROM task_tags"
+                )
+                cursor.execute("DROP TABLE task_tags")
+                cursor.execute("ALTER TABLE task_tags_new RENAME TO task_tags")
+
+            # Indexes are created after the table migrations above, since
+            # recreating a table drops any index defined on it.
+            # Week views, stats and rollover all filter on (year, week[, status]);
+            # carrying estimate lets get_week_stats read only the index.
+            # No release created idx_tasks_year_week_status; the DROP only
+            # cleans up databases opened by a development build in between.
+            cursor.execute("DROP INDEX IF EXISTS idx_tasks_year_week_status")
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_year_week_status_estimate
+                ON tasks (year, week, status, estimate)
+            """
+            )
+
+            # Appending a task reads MAX(position) within its week, and week
+            # listings sort by position; entries end in the rowid, so this index
+            # also yields the id tie-break of ORDER BY position, id
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_year_week_position
+                ON tasks (year, week, position)
+            """
+            )
+
+            # Project listings filter on project and sort by position; the project
+            # picker reads the distinct names straight from this index
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_project_position
+                ON tasks (project, position) WHERE project IS NOT NULL
+            """
+            )
 
-            # Mark migration as done
+            # Tag listings look up task_tags by tag; the primary key only
+            # covers lookups by task_id first.
             cursor.execute(
-                "INSERT INTO migrations (name, applied_at) VALUES ('assign_positions', ?)",
-                (datetime.now().isoformat(),),
+                "CREATE INDEX IF NOT EXISTS idx_task_tags_tag_id ON task_tags (tag_id)"
             )
 
-        self.conn.commit()
+            # Gather planner statistics once; close() keeps them fresh afterwards,
+            # and the shared instance from get_db() is closed at exit
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if not cursor.fetchone():
+                cursor.execute("ANALYZE")
+
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def add_task(
         self,
@@ -237,49 +634,28 @@ class Database:
         if tags is None:
             tags = []
 
-        created_at = datetime.now()
-        cursor = self.conn.cursor()
-
-        # Auto-assign position: Find max position for this week/year and add 1
-        # For inbox tasks (week/year = NULL), use separate numbering
-        if week is not None and year is not None:
+        # Timestamps are stored as whole seconds
+        created_at = datetime.now().replace(microsecond=0)
+        with self.transaction():
+            cursor = self.conn.cursor()
             cursor.execute(
-                "SELECT MAX(position) FROM tasks WHERE week = ? AND year = ?",
-                (week, year),
+                _SQL_APPEND_TASK,
+                (
+                    title,
+                    description,
+                    week,
+                    year,
+                    int(created_at.timestamp()),
+                    estimate,
+                    project,
+                    year,
+                    week,
+                ),
             )
-        else:
-            cursor.execute(
-                "SELECT MAX(position) FROM tasks WHERE week IS NULL AND year IS NULL"
-            )
-
-        max_position = cursor.fetchone()[0]
-        position = (max_position or 0) + 1
-
-        cursor.execute(
-            """
-            INSERT INTO tasks (title, description, status, week, year, created_at, estimate, project, position)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                title,
-                description,
-                TaskStatus.OPEN.value,
-                week,
-                year,
-                created_at.isoformat(),
-                estimate,
-                project,
-                position,
-            ),
-        )
+            task_id, position = cursor.fetchone()
 
-        task_id = cursor.lastrowid
-
-        # Add tags
-        for tag_name in tags:
-            self._add_tag_to_task(task_id, tag_name)
-
-        self.conn.commit()
+            # Add tags; the task carries the de-duplicated names that were stored
+            tags = self._bulk_add_tags(cursor, task_id, tags)
 
         return Task(
             id=task_id,
@@ -296,6 +672,103 @@ class Database:
             position=position,
         )
 
+    def add_tasks(
+        self,
+        tasks: list[tuple[str, str]],
+        week: int | None = None,
+        year: int | None = None,
+        schedule: bool = True,
+    ) -> list[Task]:
+        """Add several tasks in a single transaction.
+
+        Args:
+            tasks: (title, description) pairs, in the order they should be listed
+            week: ISO week number (used if schedule=True, defaults to current week)
+            year: Year (used if schedule=True, defaults to current year)
+            schedule: If True, schedule for a week; if False, add to inbox (week/year=NULL)
+
+        Returns:
+            Created tasks
+        """
+        if not tasks:
+            return []
+
+        if schedule:
+            if week is None or year is None:
+                year, week = get_current_week()
+        else:
+            # Inbox tasks - unscheduled
+            week = None
+            year = None
+
+        # Timestamps are stored as whole seconds
+        created_at = datetime.now().replace(microsecond=0)
+        created_at_ts = int(created_at.timestamp())
+        with self.transaction():
+            cursor = self.conn.cursor()
+            first_position = self._next_position(cursor, week, year)
+
+            cursor.executemany(
+                _SQL_INSERT_TASK,
+                (
+                    (
+                        title,
+                        description,
+                        _STATUS_OPEN,
+                        week,
+                        year,
+                        created_at_ts,
+                        None,
+                        None,
+                        first_position + offset,
+                    )
+                    for offset, (title, description) in enumerate(tasks)
+                ),
+            )
+
+            # The write lock is held for the whole transaction, so the
+            # AUTOINCREMENT ids of the inserted rows are contiguous
+            cursor.execute(_SQL_LAST_INSERT_ROWID)
+            first_id = cursor.fetchone()[0] - len(tasks) + 1
+
+        return [
+            Task(
+                id=first_id + offset,
+                title=title,
+                description=description,
+                status=TaskStatus.OPEN,
+                week=week,
+                year=year,
+                created_at=created_at,
+                completed_at=None,
+                tags=[],
+                position=first_position + offset,
+            )
+            for offset, (title, description) in enumerate(tasks)
+        ]
+
+    def _next_position(
+        self, cursor: sqlite3.Cursor, week: int | None, year: int | None
+    ) -> int:
+        """Get the position for a task appended to the end of a week or the inbox.
+
+        Args:
+            cursor: Cursor of the current transaction
+            week: ISO week number, or None for the inbox
+            year: Year, or None for the inbox
+
+        Returns:
+            One past the highest position currently in use
+        """
+        # Inbox tasks (week/year = NULL) use separate numbering
+        if week is not None and year is not None:
+            cursor.execute(_SQL_MAX_POSITION, (week, year))
+        else:
+            cursor.execute(_SQL_MAX_INBOX_POSITION)
+
+        max_position = cursor.fetchone()[0]
+        return (max_position or 0) + 1
+
     def get_task(self, task_id: int) -> Task | None:
         """Get a task by ID.
 
@@ -305,9 +778,7 @@ class Database:
         Returns:
             Task if found, None otherwise
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
+        row = self.conn.execute(_SQL_GET_TASK, (task_id,)).fetchone()
 
         if row is None:
             return None
@@ -332,98 +803,114 @@ class Database:
         Returns:
             List of tasks (excludes inbox tasks with NULL week/year)
         """
-        query = "SELECT * FROM tasks WHERE week IS NOT NULL AND year IS NOT NULL"
+        return list(self.iter_tasks(week, year, status, show_all))
+
+    def iter_tasks(
+        self,
+        week: int | None = None,
+        year: int | None = None,
+        status: TaskStatus | None = None,
+        show_all: bool = False,
+    ) -> Iterator[Task]:
+        """Iterate over tasks with optional filters without materializing them.
+
+        Args:
+            week: Filter by week number
+            year: Filter by year
+            status: Filter by status
+            show_all: If True, show all scheduled tasks regardless of week
+
+        Returns:
+            Iterator of tasks (excludes inbox tasks with NULL week/year)
+        """
         params = []
 
         if not show_all:
             if week is None or year is None:
                 year, week = get_current_week()
-            query += " AND week = ? AND year = ?"
             params.extend([week, year])
 
         if status is not None:
-            query += " AND status = ?"
             params.append(status.value)
 
-        query += " ORDER BY position ASC, created_at ASC"
-
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        return [self._row_to_task(row) for row in rows]
+        query = _SQL_LIST_TASKS[not show_all, status is not None]
+        return self._iter_query(query, params)
 
-    def complete_task(self, task_id: int) -> bool:
+    def complete_task(self, task_id: int) -> tuple[StatusChange, str | None]:
         """Mark a task as completed.
 
         Args:
             task_id: Task ID
 
         Returns:
-            True if task was found and updated, False otherwise
+            Tuple of (outcome, task title). Title is None if the task was not found.
         """
-        completed_at = datetime.now()
-        cursor = self.conn.cursor()
+        completed_at = int(datetime.now().timestamp())
 
-        cursor.execute(
-            """
-            UPDATE tasks
-            SET status = ?, completed_at = ?
-            WHERE id = ? AND status = ?
-        """,
-            (
-                TaskStatus.COMPLETED.value,
-                completed_at.isoformat(),
-                task_id,
-                TaskStatus.OPEN.value,
-            ),
-        )
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_COMPLETE_TASK, (completed_at, task_id))
+            row = cursor.fetchone()
 
-        self.conn.commit()
-        return cursor.rowcount > 0
+        return self._status_change(task_id, row)
 
-    def reopen_task(self, task_id: int) -> bool:
+    def reopen_task(self, task_id: int) -> tuple[StatusChange, str | None]:
         """Mark a completed task as open again.
 
         Args:
             task_id: Task ID
 
         Returns:
-            True if task was found and updated, False otherwise
+            Tuple of (outcome, task title). Title is None if the task was not found.
         """
-        cursor = self.conn.cursor()
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                _SQL_REOPEN_TASK,
+                (task_id,),
+            )
+            row = cursor.fetchone()
 
-        cursor.execute(
-            """
-            UPDATE tasks
-            SET status = ?, completed_at = NULL
-            WHERE id = ? AND status = ?
-        """,
-            (
-                TaskStatus.OPEN.value,
-                task_id,
-                TaskStatus.COMPLETED.value,
-            ),
-        )
+        return self._status_change(task_id, row)
 
-        self.conn.commit()
-        return cursor.rowcount > 0
+    def _status_change(
+        self, task_id: int, row: sqlite3.Row | None
+    ) -> tuple[StatusChange, str | None]:
+        """Classify the result of a status UPDATE ... RETURNING title.
 
-    def delete_task(self, task_id: int) -> bool:
-        """Delete a task.
+        The extra lookup only runs when the update matched no row.
 
         Args:
             task_id: Task ID
+            row: Row returned by the update, or None if nothing changed
 
         Returns:
-            True if task was found and deleted, False otherwise
+            Tuple of (outcome, task title)
         """
-        cursor = self.conn.cursor()
+        if row is not None:
+            return StatusChange.CHANGED, row["title"]
 
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        row = self.conn.execute(_SQL_GET_TASK_TITLE, (task_id,)).fetchone()
 
-        self.conn.commit()
-        return cursor.rowcount > 0
+        if row is None:
+            return StatusChange.NOT_FOUND, None
+        return StatusChange.UNCHANGED, row["title"]
+
+    def delete_task(self, task_id: int) -> str | None:
+        """Delete a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Title of the deleted task, or None if the task was not found
+        """
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_DELETE_TASK, (task_id,))
+            row = cursor.fetchone()
+
+        return row["title"] if row else None
 
     def update_task(
         self,
@@ -453,60 +940,53 @@ class Database:
         Returns:
             True if task was found and updated, False otherwise
         """
-        cursor = self.conn.cursor()
-
-        # Update title and/or description and/or estimate and/or project and/or week/year
-        updates = []
-        params = []
-
-        if title is not _UNSET:
-            updates.append("title = ?")
-            params.append(title)
-
-        if description is not _UNSET:
-            updates.append("description = ?")
-            params.append(description)
-
-        if estimate is not _UNSET:
-            updates.append("estimate = ?")
-            params.append(estimate)
-
-        if project is not _UNSET:
-            updates.append("project = ?")
-            params.append(project)
-
-        if position is not _UNSET:
-            updates.append("position = ?")
-            params.append(position)
-
-        if week is not _UNSET:
-            updates.append("week = ?")
-            params.append(week)
-
-        if year is not _UNSET:
-            updates.append("year = ?")
-            params.append(year)
-
-        if updates:
-            params.append(task_id)
-            query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
-            cursor.execute(query, params)
-
-        # Update tags if provided
-        if tags is not _UNSET:
-            # Remove existing tags
-            cursor.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
-
-            # Add new tags
-            for tag_name in tags:
-                self._add_tag_to_task(task_id, tag_name)
+        # Pair each column with its new value, skipping the ones left unset
+        assigned = [
+            (column, value)
+            for column, value in zip(
+                _UPDATE_COLUMNS,
+                (title, description, estimate, project, position, week, year),
+                strict=True,
+            )
+            if value is not _UNSET
+        ]
+
+        with self.transaction():
+            cursor = self.conn.cursor()
+
+            if assigned:
+                columns, params = zip(*assigned, strict=True)
+                query = _SQL_UPDATE_TASK.get(columns)
+                if query is None:
+                    assignments = ", ".join(f"{column} = ?" for column in columns)
+                    query = f"UPDATE tasks SET {assignments} WHERE id = ?"
+                    _SQL_UPDATE_TASK[columns] = query
+                cursor.execute(query, (*params, task_id))
+                found = cursor.rowcount > 0
+            elif tags is not _UNSET:
+                # Only tags change, so check the task exists on its own
+                cursor.execute(_SQL_TASK_EXISTS, (task_id,))
+                found = cursor.fetchone() is not None
+            else:
+                found = False
+
+            # Tag links for a missing task would violate the foreign key
+            if not found:
+                return False
+
+            # Update tags if provided
+            if tags is not _UNSET:
+                # Remove existing tags
+                cursor.execute(_SQL_DELETE_TASK_TAGS, (task_id,))
+
+                # Add new tags
+                self._bulk_add_tags(cursor, task_id, tags)
 
-        self.conn.commit()
-        return cursor.rowcount > 0 or tags is not _UNSET
+        return True
 
     def rollover_tasks(
         self, from_year: int, from_week: int, to_year: int, to_week: int
-    ) -> int:
+    ) -> list[tuple[int, str]]:
         """Move incomplete tasks from one week to another.
 
         Args:
@@ -516,25 +996,51 @@ class Database:
             to_week: Target week
 
         Returns:
-            Number of tasks rolled over
+            List of (id, title) tuples for the tasks rolled over
         """
-        cursor = self.conn.cursor()
+        return self.rollover_many([(from_year, from_week, to_year, to_week)])
 
-        cursor.execute(
-            """
-            UPDATE tasks
-            SET week = ?, year = ?
-            WHERE week = ? AND year = ? AND status = ?
-        """,
-            (to_week, to_year, from_week, from_year, TaskStatus.OPEN.value),
-        )
+    def rollover_many(
+        self, moves: list[tuple[int, int, int, int]]
+    ) -> list[tuple[int, str]]:
+        """Move incomplete tasks for several weeks in a single statement.
+
+        Every move applies to the tasks its source week held before the
+        call, so moves do not chain: to catch up several missed weeks, move
+        each of them straight to the target week. Source weeks should be
+        distinct.
+
+        Args:
+            moves: (from_year, from_week, to_year, to_week) tuples, at most
+                _MAX_ROLLOVER_MOVES of them
+
+        Returns:
+            List of (id, title) tuples for the tasks rolled over
 
-        self.conn.commit()
-        return cursor.rowcount
+        Raises:
+            ValueError: If more than _MAX_ROLLOVER_MOVES moves are given
+        """
+        # Splitting the moves over several statements would let a later
+        # statement pick up tasks an earlier one moved into its source week
+        if len(moves) > _MAX_ROLLOVER_MOVES:
+            raise ValueError(
+                f"Cannot roll over more than {_MAX_ROLLOVER_MOVES} weeks at once"
+            )
+        if not moves:
+            return []
+
+        values = ",".join(["(?, ?, ?, ?)"] * len(moves))
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                _SQL_MOVE_OPEN_TASKS.format(values=values),
+                [param for move in moves for param in move],
+            )
+            return [(row["id"], row["title"]) for row in cursor]
 
     def rollback_tasks(
         self, from_year: int, from_week: int, to_year: int, to_week: int
-    ) -> int:
+    ) -> list[tuple[int, str]]:
         """Move incomplete tasks back from next week to previous week.
 
         Args:
@@ -544,23 +1050,11 @@ class Database:
             to_week: Target week (previous week)
 
         Returns:
-            Number of tasks rolled back
+            List of (id, title) tuples for the tasks rolled back
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE tasks
-            SET week = ?, year = ?
-            WHERE week = ? AND year = ? AND status = ?
-        """,
-            (to_week, to_year, from_week, from_year, TaskStatus.OPEN.value),
-        )
-
-        self.conn.commit()
-        return cursor.rowcount
+        return self.rollover_tasks(from_year, from_week, to_year, to_week)
 
-    def get_week_stats(self, year: int, week: int) -> dict:
+    def get_week_stats(self, year: int, week: int) -> WeekStats:
         """Get statistics for a given week.
 
         Args:
@@ -568,135 +1062,146 @@ class Database:
             week: Week number
 
         Returns:
-            Dictionary with task counts and estimate totals
+            Task counts and estimate totals
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as open,
-                SUM(CASE WHEN estimate IS NOT NULL THEN estimate ELSE 0 END) as total_estimate,
-                SUM(CASE WHEN status = ? AND estimate IS NOT NULL THEN estimate ELSE 0 END) as completed_estimate,
-                SUM(CASE WHEN status = ? AND estimate IS NOT NULL THEN estimate ELSE 0 END) as open_estimate
-            FROM tasks
-            WHERE year = ? AND week = ?
-        """,
-            (
-                TaskStatus.COMPLETED.value,
-                TaskStatus.OPEN.value,
-                TaskStatus.COMPLETED.value,
-                TaskStatus.OPEN.value,
-                year,
-                week,
-            ),
+        rows = self.conn.execute(_SQL_WEEK_STATS, (year, week)).fetchall()
+
+        # One row per status present in the week
+        counts = dict.fromkeys(_STATUS_BY_VALUE, 0)
+        estimates = dict.fromkeys(_STATUS_BY_VALUE, 0)
+        for row in rows:
+            counts[row["status"]] = row["count"]
+            estimates[row["status"]] = row["estimate"] or 0
+
+        return WeekStats(
+            total=sum(counts.values()),
+            completed=counts[_STATUS_COMPLETED],
+            open=counts[_STATUS_OPEN],
+            total_estimate=sum(estimates.values()),
+            completed_estimate=estimates[_STATUS_COMPLETED],
+            open_estimate=estimates[_STATUS_OPEN],
         )
 
-        row = cursor.fetchone()
-        return {
-            "total": row["total"],
-            "completed": row["completed"],
-            "open": row["open"],
-            "total_estimate": row["total_estimate"] or 0,
-            "completed_estimate": row["completed_estimate"] or 0,
-            "open_estimate": row["open_estimate"] or 0,
-        }
-
-    def _row_to_task(self, row: sqlite3.Row) -> Task:
-        """Convert database row to Task object.
+    def _iter_query(self, query: str, params: list) -> Iterator[Task]:
+        """Run a task query and yield Task objects one batch of rows at a time.
+
+        Memory stays bounded by the batch size rather than the size of the
+        result set.
 
         Args:
-            row: Database row
+            query: SQL query selecting rows from the tasks table
+            params: Query parameters
 
-        Returns:
-            Task object
+        Yields:
+            Task objects in query order
         """
-        task_id = row["id"]
-        tags = self._get_task_tags(task_id)
+        # Plain tuples are enough for _row_to_task's positional unpacking and
+        # skip building a sqlite3.Row around every fetched row
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        while rows := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            yield from map(self._row_to_task, rows)
 
-        return Task(
-            id=task_id,
-            title=row["title"],
-            description=row["description"],
-            status=TaskStatus(row["status"]),
-            week=row["week"],
-            year=row["year"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"])
-                if row["completed_at"]
-                else None
-            ),
-            tags=tags,
-            estimate=row["estimate"] if row["estimate"] else None,
-            project=row["project"] if row["project"] else None,
-            position=(
-                row["position"] if "position" in row.keys() and row["position"] else 0
-            ),
-        )
+    def list_tasks_with_stats(
+        self, year: int, week: int
+    ) -> tuple[list[Task], WeekStats]:
+        """List all tasks for a week together with its statistics.
 
-    def _get_or_create_tag(self, tag_name: str) -> int:
-        """Get or create a tag by name.
+        Uses a single query instead of list_tasks() plus get_week_stats().
 
         Args:
-            tag_name: Tag name
+            year: Year
+            week: Week number
 
         Returns:
-            Tag ID
+            Tuple of (tasks, stats) where stats matches get_week_stats()
         """
-        cursor = self.conn.cursor()
-
-        # Try to get existing tag
-        cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-        row = cursor.fetchone()
-
-        if row:
-            return row["id"]
-
-        # Create new tag
-        cursor.execute("INSERT INTO tags (name) VALUES (?)", (tag_name,))
-        return cursor.lastrowid
+        tasks = self.list_tasks(week=week, year=year)
+        return tasks, task_stats(tasks)
 
-    def _add_tag_to_task(self, task_id: int, tag_name: str) -> None:
-        """Add a tag to a task.
+    def _row_to_task(self, row: tuple | sqlite3.Row) -> Task:
+        """Convert database row to Task object.
 
         Args:
-            task_id: Task ID
-            tag_name: Tag name
-        """
-        tag_id = self._get_or_create_tag(tag_name)
-        cursor = self.conn.cursor()
+            row: Database row selecting _TASK_COLUMNS
 
-        # Add to task_tags (ignore if already exists)
-        cursor.execute(
-            "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
-            (task_id, tag_id),
+        Returns:
+            Task object
+        """
+        # Rows come from queries selecting _TASK_COLUMNS, so unpack by position
+        # instead of paying a by-name lookup per column
+        (
+            task_id,
+            title,
+            description,
+            status,
+            week,
+            year,
+            created_at,
+            completed_at,
+            estimate,
+            project,
+            position,
+            tag_names,
+        ) = row
+
+        # Tag and project names repeat across many tasks, so they are
+        # interned and a loaded listing holds one string per distinct name
+        return Task(
+            id=task_id,
+            title=title,
+            description=description,
+            status=_STATUS_BY_VALUE[status],
+            week=week,
+            year=year,
+            created_at=_fromtimestamp(created_at),
+            completed_at=_fromtimestamp(completed_at) if completed_at else None,
+            tags=(
+                list(map(_intern, tag_names.split(_TAG_SEPARATOR))) if tag_names else []
+            ),
+            estimate=estimate or None,
+            project=_intern(project) if project else None,
+            position=position or 0,
         )
 
-    def _get_task_tags(self, task_id: int) -> list[str]:
-        """Get tags for a task.
+    def _bulk_add_tags(
+        self, cursor: sqlite3.Cursor, task_id: int, tag_names: list[str]
+    ) -> list[str]:
+        """Add tags to a task, creating any tags that don't exist yet.
+
+        Uses a fixed number of statements regardless of how many tags are given.
 
         Args:
+            cursor: Cursor of the current transaction
             task_id: Task ID
+            tag_names: Tag names
 
         Returns:
-            List of tag names
+            The tag names written, without duplicates, in their given order
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT tags.name
-            FROM tags
-            JOIN task_tags ON tags.id = task_tags.tag_id
-            WHERE task_tags.task_id = ?
-            ORDER BY tags.name
-        """,
-            (task_id,),
-        )
+        if not tag_names:
+            return []
+
+        # Repeated names would upsert the same tag row and bind the same
+        # task_tags pair more than once
+        tag_names = list(dict.fromkeys(tag_names))
+
+        for start in range(0, len(tag_names), _MAX_IN_PARAMS):
+            chunk = tag_names[start : start + _MAX_IN_PARAMS]
+            query = _SQL_UPSERT_TAGS_BY_COUNT.get(len(chunk))
+            if query is None:
+                values = ",".join(["(?)"] * len(chunk))
+                query = _SQL_UPSERT_TAGS.format(values=values)
+                _SQL_UPSERT_TAGS_BY_COUNT[len(chunk)] = query
+            cursor.execute(query, chunk)
+            # Add to task_tags (ignore if already exists)
+            cursor.executemany(
+                _SQL_INSERT_TASK_TAG,
+                [(task_id, row["id"]) for row in cursor.fetchall()],
+            )
 
-        return [row["name"] for row in cursor.fetchall()]
+        return tag_names
 
     def get_all_tags(self) -> list[str]:
         """Get all unique tags.
@@ -704,9 +1209,8 @@ class Database:
         Returns:
             List of tag names
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT name FROM tags ORDER BY name")
-        return [row["name"] for row in cursor.fetchall()]
+        rows = self.conn.execute(_SQL_GET_ALL_TAGS).fetchall()
+        return [row["name"] for row in rows]
 
     def get_all_projects(self) -> list[str]:
         """Get all unique projects.
@@ -714,11 +1218,8 @@ class Database:
         Returns:
             List of project names
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT DISTINCT project FROM tasks WHERE project IS NOT NULL ORDER BY project"
-        )
-        return [row["project"] for row in cursor.fetchall()]
+        rows = self.conn.execute(_SQL_GET_ALL_PROJECTS).fetchall()
+        return [row["project"] for row in rows]
 
     def list_tasks_by_tag(
         self,
@@ -740,32 +1241,40 @@ class Database:
         Returns:
             List of tasks
         """
-        query = """
-            SELECT DISTINCT tasks.*
-            FROM tasks
-            JOIN task_tags ON tasks.id = task_tags.task_id
-            JOIN tags ON task_tags.tag_id = tags.id
-            WHERE tags.name = ?
+        return list(self.iter_tasks_by_tag(tag, week, year, status, show_all))
+
+    def iter_tasks_by_tag(
+        self,
+        tag: str,
+        week: int | None = None,
+        year: int | None = None,
+        status: TaskStatus | None = None,
+        show_all: bool = False,
+    ) -> Iterator[Task]:
+        """Iterate over tasks filtered by tag without materializing them.
+
+        Args:
+            tag: Tag name to filter by
+            week: Filter by week number
+            year: Filter by year
+            status: Filter by status
+            show_all: If True, show all tasks regardless of week
+
+        Returns:
+            Iterator of tasks
         """
         params = [tag]
 
         if not show_all:
             if week is None or year is None:
                 year, week = get_current_week()
-            query += " AND tasks.week = ? AND tasks.year = ?"
             params.extend([week, year])
 
         if status is not None:
-            query += " AND tasks.status = ?"
             params.append(status.value)
 
-        query += " ORDER BY tasks.position ASC, tasks.created_at ASC"
-
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        return [self._row_to_task(row) for row in rows]
+        query = _SQL_LIST_TASKS_BY_TAG[not show_all, status is not None]
+        return self._iter_query(query, params)
 
     def list_tasks_by_project(
         self,
@@ -787,26 +1296,19 @@ class Database:
         Returns:
             List of tasks
         """
-        query = "SELECT * FROM tasks WHERE project = ?"
         params = [project]
 
         if not show_all:
             if week is None or year is None:
                 year, week = get_current_week()
-            query += " AND week = ? AND year = ?"
             params.extend([week, year])
 
         if status is not None:
-            query += " AND status = ?"
             params.append(status.value)
 
-        query += " ORDER BY position ASC, created_at ASC"
-
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        query = _SQL_LIST_TASKS_BY_PROJECT[not show_all, status is not None]
 
-        return [self._row_to_task(row) for row in rows]
+        return list(self._iter_query(query, params))
 
     def list_inbox_tasks(self, status: TaskStatus | None = None) -> list[Task]:
         """List inbox tasks (unscheduled tasks with week/year = NULL).
@@ -817,20 +1319,14 @@ class Database:
         Returns:
             List of inbox tasks
         """
-        query = "SELECT * FROM tasks WHERE week IS NULL AND year IS NULL"
         params = []
 
         if status is not None:
-            query += " AND status = ?"
             params.append(status.value)
 
-        query += " ORDER BY position ASC, created_at ASC"
+        query = _SQL_LIST_INBOX_TASKS[status is not None]
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        return [self._row_to_task(row) for row in rows]
+        return list(self._iter_query(query, params))
 
     def swap_task_positions(self, task_id1: int, task_id2: int) -> bool:
         """Swap positions of two tasks.
@@ -842,28 +1338,56 @@ class Database:
         Returns:
             True if swap was successful, False otherwise
         """
-        cursor = self.conn.cursor()
-
-        # Get current positions
-        cursor.execute("SELECT position FROM tasks WHERE id = ?", (task_id1,))
-        row1 = cursor.fetchone()
-        if not row1:
-            return False
-        pos1 = row1[0]
-
-        cursor.execute("SELECT position FROM tasks WHERE id = ?", (task_id2,))
-        row2 = cursor.fetchone()
-        if not row2:
-            return False
-        pos2 = row2[0]
-
-        # Swap positions
-        cursor.execute("UPDATE tasks SET position = ? WHERE id = ?", (pos2, task_id1))
-        cursor.execute("UPDATE tasks SET position = ? WHERE id = ?", (pos1, task_id2))
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(
+                _SQL_SWAP_TASK_POSITIONS,
+                (task_id1, task_id2, task_id1, task_id2, task_id1),
+            )
 
-        self.conn.commit()
-        return True
+        return cursor.rowcount > 0
 
     def close(self):
         """Close database connection."""
+        if getattr(_thread_local, "db", None) is self:
+            _thread_local.db = None
+
+        # Refresh statistics for tables whose query patterns changed, if any
+        self.conn.execute("PRAGMA optimize")
         self.conn.close()
+
+
+# Shared Database per thread. sqlite3 connections may only be used by the
+# thread that opened them, and separate WAL connections let a reader in one
+# thread run alongside a writer in another.
+_thread_local = threading.local()
+
+
+def get_db() -> Database:
+    """Get the calling thread's shared Database for the default path.
+
+    The connection is opened on first use in each thread and reused by every
+    later call from that thread.
+
+    Returns:
+        Shared Database instance
+    """
+    db = getattr(_thread_local, "db", None)
+    if db is None:
+        db = _thread_local.db = Database()
+    return db
+
+
+def _close_shared_db() -> None:
+    """Close the main thread's shared Database at exit, if still open.
+
+    atexit handlers run in the main thread, so this only reaches the
+    connection get_db() opened there; short-lived CLI commands never close
+    it themselves.
+    """
+    db = getattr(_thread_local, "db", None)
+    if db is not None:
+        db.close()
+
+
+atexit.register(_close_shared_db)
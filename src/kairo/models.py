@@ -1,8 +1,10 @@
 """Task data models."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import NamedTuple
 
 
 class TaskStatus(Enum):
@@ -12,7 +14,28 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+# Dict lookup is cheaper than calling TaskStatus(value) for every row
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+# Bound once at import; from_dict calls it for every timestamp it converts
+_fromtimestamp = datetime.fromtimestamp
+
+# Tag and project names repeat across tasks; interning shares one string each
+_intern = sys.intern
+
+
+class WeekStats(NamedTuple):
+    """Task counts and estimate totals for a week."""
+
+    total: int
+    completed: int
+    open: int
+    total_estimate: int  # Sum of estimates in hours
+    completed_estimate: int
+    open_estimate: int
+
+
+@dataclass(slots=True)
 class Task:
     """Task model."""
 
@@ -24,18 +47,22 @@ class Task:
     year: int | None  # Year for the week (None = inbox/unscheduled)
     created_at: datetime
     completed_at: datetime | None = None
-    tags: list[str] = None  # List of tag names
+    tags: list[str] = field(default_factory=list)  # List of tag names
     estimate: int | None = None  # Estimated time in hours
     project: str | None = None  # Project name
     position: int = 0  # Position in the task list for ordering
 
-    def __post_init__(self):
-        """Initialize tags to empty list if None."""
-        if self.tags is None:
-            self.tags = []
+    @property
+    def is_scheduled(self) -> bool:
+        """Whether the task is planned for a week rather than in the inbox."""
+        return self.week is not None and self.year is not None
 
     def to_dict(self) -> dict:
-        """Convert task to dictionary."""
+        """Convert task to dictionary.
+
+        Timestamps are integer Unix seconds, as stored in the database.
+        """
+        completed_at = self.completed_at
         return {
             "id": self.id,
             "title": self.title,
@@ -43,10 +70,8 @@ class Task:
             "status": self.status.value,
             "week": self.week,
             "year": self.year,
-            "created_at": self.created_at.isoformat(),
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
+            "created_at": int(self.created_at.timestamp()),
+            "completed_at": int(completed_at.timestamp()) if completed_at else None,
             "tags": self.tags,
             "estimate": self.estimate,
             "project": self.project,
@@ -60,17 +85,15 @@ class Task:
             id=data["id"],
             title=data["title"],
             description=data["description"],
-            status=TaskStatus(data["status"]),
+            status=_STATUS_BY_VALUE[data["status"]],
             week=data["week"],
             year=data["year"],
-            created_at=datetime.fromisoformat(data["created_at"]),
+            created_at=_fromtimestamp(data["created_at"]),
             completed_at=(
-                datetime.fromisoformat(data["completed_at"])
-                if data["completed_at"]
-                else None
+                _fromtimestamp(data["completed_at"]) if data["completed_at"] else None
             ),
-            tags=data.get("tags", []),
+            tags=list(map(_intern, data.get("tags") or ())),
             estimate=data.get("estimate"),
-            project=data.get("project"),
+            project=_intern(data["project"]) if data.get("project") else None,
             position=data.get("position", 0),
         )
@@ -1,13 +1,33 @@
-"""TUI screen components for Kairo."""
+"""TUI screen components for Kairo.
 
-from .confirm_delete import ConfirmDeleteScreen
-from .filter_project import FilterProjectScreen
-from .filter_select import FilterSelectScreen
-from .filter_tag import FilterTagScreen
-from .task_detail import TaskDetailScreen
-from .task_form import TaskFormScreen
-from .weekly_plan import WeeklyPlanScreen
-from .weekly_report import WeeklyReportScreen
+Screen modules are imported on first access, so a session only loads the
+dialogs it actually opens.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .confirm_delete import ConfirmDeleteScreen
+    from .filter_project import FilterProjectScreen
+    from .filter_select import FilterSelectScreen
+    from .filter_tag import FilterTagScreen
+    from .task_detail import TaskDetailScreen
+    from .task_form import TaskFormScreen
+    from .weekly_plan import WeeklyPlanScreen
+    from .weekly_report import WeeklyReportScreen
+
+# Module defining each exported screen class
+_SCREEN_MODULES = {
+    "TaskFormScreen": "task_form",
+    "FilterTagScreen": "filter_tag",
+    "FilterProjectScreen": "filter_project",
+    "FilterSelectScreen": "filter_select",
+    "ConfirmDeleteScreen": "confirm_delete",
+    "TaskDetailScreen": "task_detail",
+    "WeeklyPlanScreen": "weekly_plan",
+    "WeeklyReportScreen": "weekly_report",
+}
 
 __all__ = [
     "TaskFormScreen",
@@ -19,3 +39,22 @@ __all__ = [
     "WeeklyPlanScreen",
     "WeeklyReportScreen",
 ]
+
+
+def __getattr__(name: str) -> type:
+    """Import the module defining a screen class on first access.
+
+    Args:
+        name: Attribute name looked up on the package
+
+    Returns:
+        The screen class
+    """
+    module_name = _SCREEN_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    screen = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = screen
+    return screen
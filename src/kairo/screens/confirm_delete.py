@@ -16,33 +16,7 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
         Binding("escape", "cancel", "Cancel", show=False),
     ]
 
-    CSS = """
-    ConfirmDeleteScreen {
-        align: center middle;
-    }
-
-    #confirm_dialog {
-        width: 60;
-        height: auto;
-        border: thick $error;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #confirm_dialog Label {
-        margin: 1 0;
-    }
-
-    #confirm_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #confirm_dialog Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(self, task: Task):
         self._task_data = task
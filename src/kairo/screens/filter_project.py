@@ -16,41 +16,12 @@ class FilterProjectScreen(ModalScreen[str]):
         Binding("ctrl+d", "clear", "Clear", show=False),
     ]
 
-    CSS = """
-    FilterProjectScreen {
-        align: center middle;
-    }
-
-    #filter_dialog {
-        width: 60;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #filter_dialog Label {
-        margin: 1 0;
-    }
-
-    #filter_dialog Input {
-        margin-bottom: 1;
-    }
-
-    #filter_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #filter_dialog Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(self, current_filter: str, available_projects: list[str]):
         self._current_filter = current_filter
-        self._available_projects = available_projects
+        # Already sorted by name (Database.get_all_projects), so only join once
+        self._available_projects_label = ", ".join(available_projects)
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -72,9 +43,9 @@ class FilterProjectScreen(ModalScreen[str]):
                 id="project_input",
             )
 
-            if self._available_projects:
+            if self._available_projects_label:
                 yield Label(
-                    f"\nAvailable projects: [magenta]{', '.join(sorted(self._available_projects))}[/magenta]"
+                    f"\nAvailable projects: [magenta]{self._available_projects_label}[/magenta]"
                 )
 
             with Horizontal():
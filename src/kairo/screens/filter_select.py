@@ -17,28 +17,7 @@ class FilterSelectScreen(ModalScreen[str]):
         Binding("c", "clear_filters", "Clear", show=False),
     ]
 
-    CSS = """
-    FilterSelectScreen {
-        align: center middle;
-    }
-
-    #filter_dialog {
-        width: 50;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #filter_dialog Label {
-        margin: 1 0;
-    }
-
-    #filter_dialog Button {
-        width: 100%;
-        margin: 1 0;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def compose(self) -> ComposeResult:
         """Compose the filter selection dialog."""
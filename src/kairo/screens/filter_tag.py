@@ -16,47 +16,12 @@ class FilterTagScreen(ModalScreen[str]):
         Binding("ctrl+d", "clear", "Clear", show=False),
     ]
 
-    CSS = """
-    FilterTagScreen {
-        align: center middle;
-    }
-
-    #filter_dialog {
-        width: 60;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #filter_dialog Label {
-        margin: 1 0;
-    }
-
-    #filter_dialog Input {
-        margin-bottom: 1;
-    }
-
-    #filter_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #filter_dialog Button {
-        margin: 0 1;
-    }
-
-    #tag_list {
-        height: 10;
-        margin: 1 0;
-        border: solid $primary;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(self, current_filter: str, available_tags: list[str]):
         self._current_filter = current_filter
-        self._available_tags = available_tags
+        # Already sorted by name (Database.get_all_tags), so only join once
+        self._available_tags_label = ", ".join(available_tags)
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -76,9 +41,9 @@ class FilterTagScreen(ModalScreen[str]):
                 id="tag_input",
             )
 
-            if self._available_tags:
+            if self._available_tags_label:
                 yield Label(
-                    f"\nAvailable tags: [cyan]{', '.join(sorted(self._available_tags))}[/cyan]"
+                    f"\nAvailable tags: [cyan]{self._available_tags_label}[/cyan]"
                 )
 
             with Horizontal():
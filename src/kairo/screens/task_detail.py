@@ -17,33 +17,7 @@ class TaskDetailScreen(ModalScreen[None]):
         Binding("escape", "close", "Close", show=False),
     ]
 
-    CSS = """
-    TaskDetailScreen {
-        align: center middle;
-    }
-
-    #detail_dialog {
-        width: 80;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #detail_dialog Label {
-        margin: 1 0;
-    }
-
-    #detail_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #detail_dialog Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(self, task: Task):
         self._task_data = task
@@ -51,33 +25,33 @@ class TaskDetailScreen(ModalScreen[None]):
 
     def compose(self) -> ComposeResult:
         """Compose the task detail dialog."""
+        task = self._task_data
+
+        # The whole body is one Label, so Textual lays out a single widget.
+        # Blank lines stand in for the margins between the old per-field labels.
+        lines = [
+            f"[bold]{task.title}[/bold]",
+            f"[dim]ID: {task.id}[/dim]",
+            f"Status: {'✓ Completed' if task.status is TaskStatus.COMPLETED else '○ Open'}",
+        ]
+        if task.is_scheduled:
+            lines.append(f"Week: {format_week(task.year, task.week)}")
+        else:
+            lines.append("Week: [dim]Inbox (unscheduled)[/dim]")
+        if task.project:
+            lines.append(f"Project: [magenta]{task.project}[/magenta]")
+        if task.estimate:
+            lines.append(f"Estimate: {task.estimate} hours")
+        lines.append(f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+        if task.completed_at:
+            lines.append(f"Completed: {task.completed_at.strftime('%Y-%m-%d %H:%M')}")
+        if task.tags:
+            lines.append(f"Tags: [cyan]{', '.join(task.tags)}[/cyan]")
+        if task.description:
+            lines.append(f"\nDescription:\n{task.description}")
+
         with Vertical(id="detail_dialog"):
-            yield Label(f"[bold]{self._task_data.title}[/bold]")
-            yield Label(f"[dim]ID: {self._task_data.id}[/dim]")
-            yield Label(
-                f"Status: {'✓ Completed' if self._task_data.status == TaskStatus.COMPLETED else '○ Open'}"
-            )
-            if self._task_data.week is not None and self._task_data.year is not None:
-                yield Label(
-                    f"Week: {format_week(self._task_data.year, self._task_data.week)}"
-                )
-            else:
-                yield Label("Week: [dim]Inbox (unscheduled)[/dim]")
-            if self._task_data.project:
-                yield Label(f"Project: [magenta]{self._task_data.project}[/magenta]")
-            if self._task_data.estimate:
-                yield Label(f"Estimate: {self._task_data.estimate} hours")
-            yield Label(
-                f"Created: {self._task_data.created_at.strftime('%Y-%m-%d %H:%M')}"
-            )
-            if self._task_data.completed_at:
-                yield Label(
-                    f"Completed: {self._task_data.completed_at.strftime('%Y-%m-%d %H:%M')}"
-                )
-            if self._task_data.tags:
-                yield Label(f"Tags: [cyan]{', '.join(self._task_data.tags)}[/cyan]")
-            if self._task_data.description:
-                yield Label(f"\nDescription:\n{self._task_data.description}")
+            yield Label("\n\n".join(lines))
             with Horizontal():
                 yield Button("Close", variant="primary", id="close_btn")
 
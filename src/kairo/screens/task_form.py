@@ -1,14 +1,15 @@
 """Unified task form screen for adding and editing tasks."""
 
+import sqlite3
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Checkbox, Input, Label, TextArea
 
-from ..database import Database
 from ..models import Task
-from ..utils import format_week, get_current_week
+from ..utils import format_week, get_current_week, parse_tags
 
 
 class TaskFormScreen(ModalScreen[bool]):
@@ -19,73 +20,7 @@ class TaskFormScreen(ModalScreen[bool]):
         Binding("ctrl+s", "save", "Save", show=False),
     ]
 
-    CSS = """
-    TaskFormScreen {
-        align: center middle;
-    }
-
-    #task_dialog {
-        width: 90;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1;
-    }
-
-    #task_dialog > Label {
-        margin-bottom: 0;
-    }
-
-    #task_dialog Label {
-        margin: 0;
-        padding: 0;
-    }
-
-    #task_dialog Input {
-        margin: 0;
-        height: 3;
-    }
-
-    #task_dialog TextArea {
-        height: 5;
-        margin: 0;
-    }
-
-    #task_dialog .field-row {
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    #task_dialog .two-col {
-        width: 1fr;
-        height: auto;
-    }
-
-    #task_dialog .two-col Label {
-        height: 1;
-    }
-
-    #task_dialog .two-col:last-child {
-        margin-left: 1;
-    }
-
-    #task_dialog .button-row {
-        height: 3;
-        align: center middle;
-        margin-top: 0;
-    }
-
-    #task_dialog Button {
-        margin: 0 1;
-        min-width: 12;
-        height: 3;
-    }
-
-    #task_dialog Checkbox {
-        margin: 0;
-        padding-top: 1;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(
         self,
@@ -116,17 +51,14 @@ class TaskFormScreen(ModalScreen[bool]):
         """Compose the task form dialog."""
         # Determine values based on edit mode
         if self.is_edit:
-            title_text = f"[bold]Edit Task - {self._task_data.id}[/bold]"
-            title_value = self._task_data.title
-            desc_value = self._task_data.description or ""
-            tags_value = ", ".join(self._task_data.tags) if self._task_data.tags else ""
-            project_value = self._task_data.project if self._task_data.project else ""
-            estimate_value = (
-                str(self._task_data.estimate) if self._task_data.estimate else ""
-            )
-            is_scheduled = (
-                self._task_data.week is not None and self._task_data.year is not None
-            )
+            task = self._task_data
+            title_text = f"[bold]Edit Task - {task.id}[/bold]"
+            title_value = task.title
+            desc_value = task.description or ""
+            tags_value = ", ".join(task.tags) if task.tags else ""
+            project_value = task.project if task.project else ""
+            estimate_value = str(task.estimate) if task.estimate else ""
+            is_scheduled = task.is_scheduled
             button_text = "Save"
             checkbox_label = "Scheduled (uncheck for Inbox)"
         else:
@@ -148,48 +80,54 @@ class TaskFormScreen(ModalScreen[bool]):
             # Title field
             with Vertical(classes="field-row"):
                 yield Label("Title:")
-                yield Input(
+                self._title_input = Input(
                     value=title_value,
                     placeholder="Enter task title",
                     id="title_input",
                 )
+                yield self._title_input
 
             # Description field (compact)
             with Vertical(classes="field-row"):
                 yield Label("Description:")
-                yield TextArea(desc_value, id="desc_input")
+                self._desc_input = TextArea(desc_value, id="desc_input")
+                yield self._desc_input
 
             # Tags and Project on same row
             with Horizontal(classes="field-row"):
                 with Vertical(classes="two-col"):
                     yield Label("Tags:")
-                    yield Input(
+                    self._tags_input = Input(
                         value=tags_value,
                         placeholder="work, urgent",
                         id="tags_input",
                     )
+                    yield self._tags_input
                 with Vertical(classes="two-col"):
                     yield Label("Project:")
-                    yield Input(
+                    self._project_input = Input(
                         value=project_value,
                         placeholder="Website Redesign",
                         id="project_input",
                     )
+                    yield self._project_input
 
             # Estimate and Schedule on same row
             with Horizontal(classes="field-row"):
                 with Vertical(classes="two-col"):
                     yield Label("Estimate (hours):")
-                    yield Input(
+                    self._estimate_input = Input(
                         value=estimate_value,
                         placeholder="2",
                         id="estimate_input",
                         type="integer",
                     )
+                    yield self._estimate_input
                 with Vertical(classes="two-col"):
-                    yield Checkbox(
+                    self._schedule_checkbox = Checkbox(
                         checkbox_label, value=is_scheduled, id="schedule_checkbox"
                     )
+                    yield self._schedule_checkbox
 
             # Buttons
             with Horizontal(classes="button-row"):
@@ -198,89 +136,105 @@ class TaskFormScreen(ModalScreen[bool]):
 
     def _save_task(self) -> None:
         """Save the task (add or update)."""
-        title_input = self.query_one("#title_input", Input)
-        desc_input = self.query_one("#desc_input", TextArea)
-        tags_input = self.query_one("#tags_input", Input)
-        project_input = self.query_one("#project_input", Input)
-        estimate_input = self.query_one("#estimate_input", Input)
-        schedule_checkbox = self.query_one("#schedule_checkbox", Checkbox)
-
-        if not title_input.value.strip():
+        # Widgets are kept from compose(), so no DOM query is needed
+        title_input = self._title_input
+        desc_input = self._desc_input
+        tags_input = self._tags_input
+        project_input = self._project_input
+        estimate_input = self._estimate_input
+        schedule_checkbox = self._schedule_checkbox
+
+        title = title_input.value.strip()
+        if not title:
             title_input.focus()
             return
 
         # Parse tags from comma-separated input
-        tag_list = [tag.strip() for tag in tags_input.value.split(",") if tag.strip()]
+        tag_list = parse_tags(tags_input.value)
 
         # Get project value
-        project = project_input.value.strip() if project_input.value.strip() else None
-
-        # Parse estimate (convert to int if provided)
-        estimate = None
-        if estimate_input.value.strip():
-            try:
-                estimate = int(estimate_input.value.strip())
-            except ValueError:
-                pass  # Ignore invalid input
+        project = project_input.value.strip() or None
+
+        # Parse estimate (convert to int if provided). isdecimal() accepts
+        # exactly the digits int() does, so no exception is raised and caught
+        # along the way; anything else keeps the form open with a warning.
+        estimate_text = estimate_input.value.strip()
+        if estimate_text.isdecimal():
+            estimate = int(estimate_text)
+        elif estimate_text:
+            self.notify(
+                f"Invalid estimate: {estimate_text} (use whole hours)",
+                severity="warning",
+            )
+            estimate_input.focus()
+            return
+        else:
+            estimate = None
 
-        db = Database()
+        if self.is_edit:
+            # Update existing task
+            # Determine week/year based on schedule checkbox
+            if schedule_checkbox.value:
+                # Schedule to current week if moving from inbox
+                if not self._task_data.is_scheduled:
+                    year, week = get_current_week()
+                else:
+                    # Keep existing schedule
+                    week = self._task_data.week
+                    year = self._task_data.year
+            else:
+                # Move to inbox (unschedule)
+                week = None
+                year = None
+
+            changes = {
+                "title": title,
+                "description": desc_input.text.strip(),
+                "tags": tag_list,
+                "estimate": estimate,
+                "project": project,
+                "week": week,
+                "year": year,
+            }
+        else:
+            # Add new task
+            changes = {
+                "title": title,
+                "description": desc_input.text.strip(),
+                "week": self.week,
+                "year": self.year,
+                "tags": tag_list,
+                "estimate": estimate,
+                "project": project,
+                "schedule": schedule_checkbox.value,
+            }
+
+        # Writes go through the app's connection, like every other TUI write.
+        # On failure the form stays open so the input isn't lost.
+        db = self.app.db
         try:
             if self.is_edit:
-                # Update existing task
-                # Determine week/year based on schedule checkbox
-                if schedule_checkbox.value:
-                    # Schedule to current week if moving from inbox
-                    if self._task_data.week is None or self._task_data.year is None:
-                        year, week = get_current_week()
-                    else:
-                        # Keep existing schedule
-                        week = self._task_data.week
-                        year = self._task_data.year
-                else:
-                    # Move to inbox (unschedule)
-                    week = None
-                    year = None
-
-                db.update_task(
-                    self._task_data.id,
-                    title=title_input.value.strip(),
-                    description=desc_input.text.strip(),
-                    tags=tag_list,
-                    estimate=estimate,
-                    project=project,
-                    week=week,
-                    year=year,
-                )
+                db.update_task(self._task_data.id, **changes)
             else:
-                # Add new task
-                db.add_task(
-                    title=title_input.value.strip(),
-                    description=desc_input.text.strip(),
-                    week=self.week,
-                    year=self.year,
-                    tags=tag_list,
-                    estimate=estimate,
-                    project=project,
-                    schedule=schedule_checkbox.value,
-                )
+                db.add_task(**changes)
+        except sqlite3.Error as e:
+            self.notify(f"Error saving task: {e}", severity="error")
+            return
 
-            self.dismiss(True)
-        finally:
-            db.close()
+        self.dismiss(True)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "save_btn":
             self._save_task()
         else:
-            self.dismiss(False)
+            self.action_cancel()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key in title input."""
         if event.input.id == "title_input":
             # Move focus to description
-            desc_input = self.query_one("#desc_input", TextArea)
-            desc_input.focus()
+            self._desc_input.focus()
 
     def action_cancel(self) -> None:
         """Cancel and close the dialog."""
@@ -1,5 +1,9 @@
 """Weekly plan screen for Kairo TUI."""
 
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import NamedTuple
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -9,6 +13,78 @@ from textual.widgets import Button, Static
 from ..models import Task
 from ..utils import format_week
 
+# Resolved once at import; None when pyperclip is not installed
+try:
+    from pyperclip import copy as _copy_to_clipboard
+except ImportError:
+    _copy_to_clipboard = None
+
+
+class _PlanItem(NamedTuple):
+    """Task fields the plan text is built from, hashable for caching."""
+
+    title: str
+    estimate: int | None
+    project: str | None
+
+
+@lru_cache(maxsize=32)
+def _build_plan_text(items: tuple[_PlanItem, ...], week_label: str) -> str:
+    """Generate formatted plan text - simple list of planned tasks.
+
+    Cached by content, so reopening the plan for unchanged tasks reuses the
+    text built the first time.
+
+    Args:
+        items: Planned tasks in display order
+        week_label: Week in YYYY-Wnn format
+
+    Returns:
+        Plan text
+    """
+    lines = []
+    lines.append(f"Weekly Plan - Week {week_label}")
+    lines.append("=" * 60)
+    lines.append("")
+
+    # Group tasks by project and total estimates in one pass
+    projects = defaultdict(list)
+    unassigned = []
+    total_estimate = 0
+
+    for task in items:
+        if task.project:
+            projects[task.project].append(task)
+        else:
+            unassigned.append(task)
+        if task.estimate:
+            total_estimate += task.estimate
+
+    lines.append(f"Total Tasks Planned: {len(items)}")
+    if total_estimate > 0:
+        lines.append(f"Total Estimated Hours: {total_estimate}h")
+    lines.append("")
+
+    lines.append("My plan for this week:")
+    lines.append("")
+
+    # Display tasks by project
+    if projects:
+        for project, project_tasks in sorted(projects.items()):
+            lines.append(f"{project}:")
+            for task in project_tasks:
+                lines.append(f"  • {task.title}")
+            lines.append("")
+
+    # Display unassigned tasks
+    if unassigned:
+        if projects:  # Only add header if we had projects
+            lines.append("Other:")
+        for task in unassigned:
+            lines.append(f"  • {task.title}")
+
+    return "\n".join(lines)
+
 
 class WeeklyPlanScreen(ModalScreen[None]):
     """Modal screen for viewing and copying weekly plan."""
@@ -18,101 +94,23 @@ class WeeklyPlanScreen(ModalScreen[None]):
         Binding("ctrl+c", "copy", "Copy", show=False),
     ]
 
-    CSS = """
-    WeeklyPlanScreen {
-        align: center middle;
-    }
-
-    #plan_dialog {
-        width: 90;
-        height: auto;
-        max-height: 90%;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #plan_content {
-        height: auto;
-        max-height: 70vh;
-        overflow-y: auto;
-        border: solid $accent;
-        background: $panel;
-        padding: 1;
-        margin: 1 0;
-    }
-
-    #plan_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #plan_dialog Button {
-        margin: 0 1;
-    }
-    """
+    CSS_PATH = "modals.tcss"
 
     def __init__(self, tasks: list[Task], year: int, week: int):
         self._tasks = tasks
-        self._year = year
-        self._week = week
-        self._plan_text = self._generate_plan_text()
+        self._week_label = format_week(year, week)
         super().__init__()
 
-    def _generate_plan_text(self) -> str:
-        """Generate formatted plan text - simple list of planned tasks."""
-        lines = []
-        lines.append(f"Weekly Plan - Week {format_week(self._year, self._week)}")
-        lines.append("=" * 60)
-        lines.append("")
-
-        # Calculate total estimate
-        total_estimate = sum(t.estimate for t in self._tasks if t.estimate)
-
-        lines.append(f"Total Tasks Planned: {len(self._tasks)}")
-        if total_estimate > 0:
-            lines.append(f"Total Estimated Hours: {total_estimate}h")
-        lines.append("")
-
-        lines.append("My plan for this week:")
-        lines.append("")
-
-        # Group tasks by project
-        projects = {}
-        unassigned = []
-
-        for task in self._tasks:
-            if task.project:
-                if task.project not in projects:
-                    projects[task.project] = []
-                projects[task.project].append(task)
-            else:
-                unassigned.append(task)
-
-        # Display tasks by project
-        if projects:
-            for project, project_tasks in sorted(projects.items()):
-                lines.append(f"{project}:")
-                for task in project_tasks:
-                    lines.append(f"  • {task.title}")
-                lines.append("")
-
-        # Display unassigned tasks
-        if unassigned:
-            if projects:  # Only add header if we had projects
-                lines.append("Other:")
-            for task in unassigned:
-                lines.append(f"  • {task.title}")
-
-        return "\n".join(lines)
+    @cached_property
+    def _plan_text(self) -> str:
+        """Plan text, built when the screen is first composed."""
+        items = tuple(_PlanItem(t.title, t.estimate, t.project) for t in self._tasks)
+        return _build_plan_text(items, self._week_label)
 
     def compose(self) -> ComposeResult:
         """Compose the weekly plan dialog."""
         with Vertical(id="plan_dialog"):
-            yield Static(
-                f"[bold]Weekly Plan - Week {format_week(self._year, self._week)}[/bold]"
-            )
+            yield Static(f"[bold]Weekly Plan - Week {self._week_label}[/bold]")
             yield Static(
                 "[dim]Copy this plan to share with your team (Ctrl+C to copy to clipboard)[/dim]"
             )
@@ -131,17 +129,17 @@ class WeeklyPlanScreen(ModalScreen[None]):
 
     def action_copy(self) -> None:
         """Copy plan to clipboard."""
-        try:
-            import pyperclip
-
-            pyperclip.copy(self._plan_text)
-            self.notify("Weekly plan copied to clipboard!")
-        except ImportError:
+        if _copy_to_clipboard is None:
             # Fallback if pyperclip is not available
             self.notify(
                 "Could not copy to clipboard. Please install pyperclip: pip install pyperclip",
                 severity="warning",
             )
+            return
+
+        try:
+            _copy_to_clipboard(self._plan_text)
+            self.notify("Weekly plan copied to clipboard!")
         except Exception as e:
             self.notify(f"Error copying to clipboard: {str(e)}", severity="error")
 
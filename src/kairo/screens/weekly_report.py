@@ -1,5 +1,9 @@
 """Weekly report screen for Kairo TUI."""
 
+from collections import defaultdict
+from functools import cached_property, lru_cache
+from typing import NamedTuple
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -9,197 +13,214 @@ from textual.widgets import Button, Static
 from ..models import Task, TaskStatus
 from ..utils import format_week
 
+# Resolved once at import; None when pyperclip is not installed
+try:
+    from pyperclip import copy as _copy_to_clipboard
+except ImportError:
+    _copy_to_clipboard = None
+
+# Full report for a week with no tasks: the summary with every count at zero
+_EMPTY_REPORT = "\n".join(
+    [
+        "Weekly Report - Week {week_label}",
+        "=" * 60,
+        "",
+        "📊 SUMMARY",
+        "-" * 60,
+        "Total Tasks Planned: 0",
+        "✓ Completed: 0",
+        "○ Open/In Progress: 0",
+        "",
+    ]
+)
 
-class WeeklyReportScreen(ModalScreen[None]):
-    """Modal screen for viewing comprehensive weekly report."""
 
-    BINDINGS = [
-        Binding("escape", "close", "Close", show=False),
-        Binding("ctrl+c", "copy", "Copy", show=False),
-    ]
+class _ReportItem(NamedTuple):
+    """Task fields the report text is built from, hashable for caching."""
+
+    title: str
+    status: TaskStatus
+    estimate: int | None
+    project: str | None
+    tags: tuple[str, ...]
+
+
+@lru_cache(maxsize=32)
+def _build_report_text(items: tuple[_ReportItem, ...], week_label: str) -> str:
+    """Generate formatted report text with planned vs done analysis.
+
+    Cached by content, so reopening the report for unchanged tasks reuses
+    the text built the first time.
+
+    Args:
+        items: Tasks for the week in display order
+        week_label: Week in YYYY-Wnn format
 
-    CSS = """
-    WeeklyReportScreen {
-        align: center middle;
-    }
-
-    #report_dialog {
-        width: 90;
-        height: auto;
-        max-height: 90%;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-
-    #report_content {
-        height: auto;
-        max-height: 70vh;
-        overflow-y: auto;
-        border: solid $accent;
-        background: $panel;
-        padding: 1;
-        margin: 1 0;
-    }
-
-    #report_dialog Horizontal {
-        height: auto;
-        align: center middle;
-        margin-top: 1;
-    }
-
-    #report_dialog Button {
-        margin: 0 1;
-    }
+    Returns:
+        Report text
     """
+    if not items:
+        return _EMPTY_REPORT.format(week_label=week_label)
+
+    lines = []
+    lines.append(f"Weekly Report - Week {week_label}")
+    lines.append("=" * 60)
+    lines.append("")
+
+    # Split by status, group by project and total estimates in one pass.
+    # Each task's display strings are built once here: the short form
+    # (title and estimate) for the top-5 lists, the full form (plus tags)
+    # for the per-project sections.
+    open_tasks, completed_tasks = [], []
+    open_by_project, completed_by_project = defaultdict(list), defaultdict(list)
+    open_unassigned, completed_unassigned = [], []
+    completed_estimate = open_estimate = 0
+
+    for task in items:
+        short = f"{task.title} ({task.estimate}h)" if task.estimate else task.title
+        full = f"{short} [{', '.join(task.tags)}]" if task.tags else short
+
+        if task.status is TaskStatus.COMPLETED:
+            completed_tasks.append(short)
+            if task.project:
+                completed_by_project[task.project].append(full)
+            else:
+                completed_unassigned.append(full)
+            if task.estimate:
+                completed_estimate += task.estimate
+        else:
+            open_tasks.append(short)
+            if task.project:
+                open_by_project[task.project].append(full)
+            else:
+                open_unassigned.append(full)
+            if task.estimate:
+                open_estimate += task.estimate
+
+    total_estimate = completed_estimate + open_estimate
+
+    # Project names are sorted once; each section picks out its own projects
+    project_order = sorted(completed_by_project.keys() | open_by_project.keys())
+
+    # SUMMARY SECTION
+    lines.append("📊 SUMMARY")
+    lines.append("-" * 60)
+    lines.append(f"Total Tasks Planned: {len(items)}")
+    lines.append(f"✓ Completed: {len(completed_tasks)}")
+    lines.append(f"○ Open/In Progress: {len(open_tasks)}")
+
+    if len(items) > 0:
+        completion_rate = (len(completed_tasks) / len(items)) * 100
+        lines.append(f"Completion Rate: {completion_rate:.0f}%")
+
+    if total_estimate > 0:
+        lines.append(f"\nTotal Hours Planned: {total_estimate}h")
+        lines.append(f"✓ Hours Completed: {completed_estimate}h")
+        lines.append(f"○ Hours Remaining: {open_estimate}h")
+        if total_estimate > 0:
+            time_completion = (completed_estimate / total_estimate) * 100
+            lines.append(f"Time Completion Rate: {time_completion:.0f}%")
 
-    def __init__(self, tasks: list[Task], year: int, week: int):
-        self._tasks = tasks
-        self._year = year
-        self._week = week
-        self._report_text = self._generate_report_text()
-        super().__init__()
+    lines.append("")
 
-    def _generate_report_text(self) -> str:
-        """Generate formatted report text with planned vs done analysis."""
-        lines = []
-        lines.append(f"Weekly Report - Week {format_week(self._year, self._week)}")
-        lines.append("=" * 60)
-        lines.append("")
+    # COMPLETED TASKS SECTION
+    if completed_tasks:
+        lines.append("✅ COMPLETED TASKS")
+        lines.append("-" * 60)
 
-        # Group tasks by status
-        open_tasks = [t for t in self._tasks if t.status == TaskStatus.OPEN]
-        completed_tasks = [t for t in self._tasks if t.status == TaskStatus.COMPLETED]
+        # Display completed by project
+        if completed_by_project:
+            for project in project_order:
+                project_tasks = completed_by_project.get(project)
+                if not project_tasks:
+                    continue
+                lines.append(f"\n{project}:")
+                for entry in project_tasks:
+                    lines.append(f"  ✓ {entry}")
+
+        # Display completed unassigned
+        if completed_unassigned:
+            if completed_by_project:
+                lines.append("\nOther:")
+            for entry in completed_unassigned:
+                lines.append(f"  ✓ {entry}")
 
-        # Calculate estimates
-        total_estimate = sum(t.estimate for t in self._tasks if t.estimate)
-        completed_estimate = sum(t.estimate for t in completed_tasks if t.estimate)
-        open_estimate = sum(t.estimate for t in open_tasks if t.estimate)
+        lines.append("")
 
-        # SUMMARY SECTION
-        lines.append("📊 SUMMARY")
+    # OPEN/IN PROGRESS TASKS SECTION
+    if open_tasks:
+        lines.append("📝 OPEN/IN PROGRESS")
         lines.append("-" * 60)
-        lines.append(f"Total Tasks Planned: {len(self._tasks)}")
-        lines.append(f"✓ Completed: {len(completed_tasks)}")
-        lines.append(f"○ Open/In Progress: {len(open_tasks)}")
 
-        if len(self._tasks) > 0:
-            completion_rate = (len(completed_tasks) / len(self._tasks)) * 100
-            lines.append(f"Completion Rate: {completion_rate:.0f}%")
+        # Display open by project
+        if open_by_project:
+            for project in project_order:
+                project_tasks = open_by_project.get(project)
+                if not project_tasks:
+                    continue
+                lines.append(f"\n{project}:")
+                for entry in project_tasks:
+                    lines.append(f"  ○ {entry}")
+
+        # Display open unassigned
+        if open_unassigned:
+            if open_by_project:
+                lines.append("\nOther:")
+            for entry in open_unassigned:
+                lines.append(f"  ○ {entry}")
 
-        if total_estimate > 0:
-            lines.append(f"\nTotal Hours Planned: {total_estimate}h")
-            lines.append(f"✓ Hours Completed: {completed_estimate}h")
-            lines.append(f"○ Hours Remaining: {open_estimate}h")
-            if total_estimate > 0:
-                time_completion = (completed_estimate / total_estimate) * 100
-                lines.append(f"Time Completion Rate: {time_completion:.0f}%")
+        lines.append("")
 
+    # KEY ACHIEVEMENTS (if any completed tasks)
+    if completed_tasks:
+        lines.append("🎯 KEY ACHIEVEMENTS")
+        lines.append("-" * 60)
+        for entry in completed_tasks[:5]:  # Show top 5 completed
+            lines.append(f"• {entry}")
+        if len(completed_tasks) > 5:
+            lines.append(f"... and {len(completed_tasks) - 5} more")
         lines.append("")
 
-        # COMPLETED TASKS SECTION
-        if completed_tasks:
-            lines.append("✅ COMPLETED TASKS")
-            lines.append("-" * 60)
+    # NEXT WEEK PRIORITIES (carry-forward open tasks)
+    if open_tasks:
+        lines.append("⏭️  CARRY FORWARD TO NEXT WEEK")
+        lines.append("-" * 60)
+        for entry in open_tasks[:5]:  # Show top 5 open
+            lines.append(f"• {entry}")
+        if len(open_tasks) > 5:
+            lines.append(f"... and {len(open_tasks) - 5} more")
 
-            # Group completed by project
-            completed_by_project = {}
-            completed_unassigned = []
+    return "\n".join(lines)
 
-            for task in completed_tasks:
-                if task.project:
-                    if task.project not in completed_by_project:
-                        completed_by_project[task.project] = []
-                    completed_by_project[task.project].append(task)
-                else:
-                    completed_unassigned.append(task)
 
-            # Display completed by project
-            if completed_by_project:
-                for project, project_tasks in sorted(completed_by_project.items()):
-                    lines.append(f"\n{project}:")
-                    for task in project_tasks:
-                        estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                        tags_str = f" [{', '.join(task.tags)}]" if task.tags else ""
-                        lines.append(f"  ✓ {task.title}{estimate_str}{tags_str}")
-
-            # Display completed unassigned
-            if completed_unassigned:
-                if completed_by_project:
-                    lines.append("\nOther:")
-                for task in completed_unassigned:
-                    estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                    tags_str = f" [{', '.join(task.tags)}]" if task.tags else ""
-                    lines.append(f"  ✓ {task.title}{estimate_str}{tags_str}")
-
-            lines.append("")
-
-        # OPEN/IN PROGRESS TASKS SECTION
-        if open_tasks:
-            lines.append("📝 OPEN/IN PROGRESS")
-            lines.append("-" * 60)
-
-            # Group open by project
-            open_by_project = {}
-            open_unassigned = []
-
-            for task in open_tasks:
-                if task.project:
-                    if task.project not in open_by_project:
-                        open_by_project[task.project] = []
-                    open_by_project[task.project].append(task)
-                else:
-                    open_unassigned.append(task)
-
-            # Display open by project
-            if open_by_project:
-                for project, project_tasks in sorted(open_by_project.items()):
-                    lines.append(f"\n{project}:")
-                    for task in project_tasks:
-                        estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                        tags_str = f" [{', '.join(task.tags)}]" if task.tags else ""
-                        lines.append(f"  ○ {task.title}{estimate_str}{tags_str}")
-
-            # Display open unassigned
-            if open_unassigned:
-                if open_by_project:
-                    lines.append("\nOther:")
-                for task in open_unassigned:
-                    estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                    tags_str = f" [{', '.join(task.tags)}]" if task.tags else ""
-                    lines.append(f"  ○ {task.title}{estimate_str}{tags_str}")
-
-            lines.append("")
-
-        # KEY ACHIEVEMENTS (if any completed tasks)
-        if completed_tasks:
-            lines.append("🎯 KEY ACHIEVEMENTS")
-            lines.append("-" * 60)
-            for task in completed_tasks[:5]:  # Show top 5 completed
-                estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                lines.append(f"• {task.title}{estimate_str}")
-            if len(completed_tasks) > 5:
-                lines.append(f"... and {len(completed_tasks) - 5} more")
-            lines.append("")
-
-        # NEXT WEEK PRIORITIES (carry-forward open tasks)
-        if open_tasks:
-            lines.append("⏭️  CARRY FORWARD TO NEXT WEEK")
-            lines.append("-" * 60)
-            for task in open_tasks[:5]:  # Show top 5 open
-                estimate_str = f" ({task.estimate}h)" if task.estimate else ""
-                lines.append(f"• {task.title}{estimate_str}")
-            if len(open_tasks) > 5:
-                lines.append(f"... and {len(open_tasks) - 5} more")
-
-        return "\n".join(lines)
+class WeeklyReportScreen(ModalScreen[None]):
+    """Modal screen for viewing comprehensive weekly report."""
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", show=False),
+        Binding("ctrl+c", "copy", "Copy", show=False),
+    ]
+
+    CSS_PATH = "modals.tcss"
+
+    def __init__(self, tasks: list[Task], year: int, week: int):
+        self._tasks = tasks
+        self._week_label = format_week(year, week)
+        super().__init__()
+
+    @cached_property
+    def _report_text(self) -> str:
+        """Report text, built when the screen is first composed."""
+        items = tuple(
+            _ReportItem(t.title, t.status, t.estimate, t.project, tuple(t.tags))
+            for t in self._tasks
+        )
+        return _build_report_text(items, self._week_label)
 
     def compose(self) -> ComposeResult:
         """Compose the weekly report dialog."""
         with Vertical(id="report_dialog"):
-            yield Static(
-                f"[bold]Weekly Report - Week {format_week(self._year, self._week)}[/bold]"
-            )
+            yield Static(f"[bold]Weekly Report - Week {self._week_label}[/bold]")
             yield Static(
                 "[dim]Comprehensive report of planned vs completed tasks (Ctrl+C to copy)[/dim]"
             )
@@ -218,16 +239,16 @@ class WeeklyReportScreen(ModalScreen[None]):
 
     def action_copy(self) -> None:
         """Copy report to clipboard."""
-        try:
-            import pyperclip
-
-            pyperclip.copy(self._report_text)
-            self.notify("Weekly report copied to clipboard!")
-        except ImportError:
+        if _copy_to_clipboard is None:
             self.notify(
                 "Could not copy to clipboard. Please install pyperclip: pip install pyperclip",
                 severity="warning",
             )
+            return
+
+        try:
+            _copy_to_clipboard(self._report_text)
+            self.notify("Weekly report copied to clipboard!")
         except Exception as e:
             self.notify(f"Error copying to clipboard: {str(e)}", severity="error")
 
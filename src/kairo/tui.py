@@ -9,18 +9,9 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.reactive import reactive
 from textual.widgets import Button, DataTable, Footer, Header, Static
 
-from .database import Database
+from . import screens
+from .database import StatusChange, get_db, task_stats
 from .models import TaskStatus
-from .screens import (
-    ConfirmDeleteScreen,
-    FilterProjectScreen,
-    FilterSelectScreen,
-    FilterTagScreen,
-    TaskDetailScreen,
-    TaskFormScreen,
-    WeeklyPlanScreen,
-    WeeklyReportScreen,
-)
 from .utils import format_week, get_current_week, get_next_week
 
 
@@ -124,21 +115,24 @@ class KairoApp(App):
         Binding("q", "quit", "Quit", key_display="q"),
     ]
 
-    current_year = reactive(0)
-    current_week = reactive(0)
-    current_tag_filter = reactive("")
-    current_project_filter = reactive("")
-    inbox_tag_filter = reactive("")
-    inbox_project_filter = reactive("")
-    viewing_inbox = reactive(False)
+    # Watchers reload the task table; on_mount does the first load itself
+    current_year = reactive(0, init=False)
+    current_week = reactive(0, init=False)
+    current_tag_filter = reactive("", init=False)
+    current_project_filter = reactive("", init=False)
+    inbox_tag_filter = reactive("", init=False)
+    inbox_project_filter = reactive("", init=False)
+    viewing_inbox = reactive(False, init=False)
 
     def __init__(self):
         super().__init__()
-        self.db = Database()
+        self.db = get_db()
         self._loaded_tag_filter = None
         self._loaded_project_filter = None
         self._loaded_inbox_tag_filter = None
         self._loaded_inbox_project_filter = None
+        # Cells currently shown in the task table, by row key, in row order
+        self._table_rows = {}
         self._load_state()
 
     def _load_state(self):
@@ -248,34 +242,43 @@ class KairoApp(App):
     def on_mount(self) -> None:
         """Initialize the app when mounted."""
         table = self.query_one("#task_table", DataTable)
-        table.add_column("ID", width=6)
-        table.add_column("Status", width=8)
-        table.add_column("Title", width=None)  # Takes remaining space
-        table.add_column("Project", width=20)
-        table.add_column("Tags", width=20)
-        table.add_column("Est", width=6)  # Estimate in hours
+        self._column_keys = (
+            table.add_column("ID", width=6),
+            table.add_column("Status", width=8),
+            table.add_column("Title", width=None),  # Takes remaining space
+            table.add_column("Project", width=20),
+            table.add_column("Tags", width=20),
+            table.add_column("Est", width=6),  # Estimate in hours
+        )
         table.cursor_type = "row"
         table.zebra_stripes = True
 
-        # Set current week after mounting to avoid watcher issues
+        # Initial values are set without firing watchers, so the table is
+        # loaded once below rather than once per reactive
         year, week = get_current_week()
-        self.current_year = year
-        self.current_week = week
+        self.set_reactive(KairoApp.current_year, year)
+        self.set_reactive(KairoApp.current_week, week)
 
         # Apply loaded tag filter if any
         if self._loaded_tag_filter:
-            self.current_tag_filter = self._loaded_tag_filter
+            self.set_reactive(KairoApp.current_tag_filter, self._loaded_tag_filter)
 
         # Apply loaded project filter if any
         if self._loaded_project_filter:
-            self.current_project_filter = self._loaded_project_filter
+            self.set_reactive(
+                KairoApp.current_project_filter, self._loaded_project_filter
+            )
 
         # Apply loaded inbox filters if any
         if self._loaded_inbox_tag_filter:
-            self.inbox_tag_filter = self._loaded_inbox_tag_filter
+            self.set_reactive(KairoApp.inbox_tag_filter, self._loaded_inbox_tag_filter)
 
         if self._loaded_inbox_project_filter:
-            self.inbox_project_filter = self._loaded_inbox_project_filter
+            self.set_reactive(
+                KairoApp.inbox_project_filter, self._loaded_inbox_project_filter
+            )
+
+        self.load_tasks()
 
         # Set focus to task table
         table.focus()
@@ -346,21 +349,8 @@ class KairoApp(App):
         else:
             tasks = self.db.list_tasks(week=self.current_week, year=self.current_year)
 
-        # Calculate stats from filtered tasks
-        stats = {
-            "total": len(tasks),
-            "completed": sum(1 for t in tasks if t.status == TaskStatus.COMPLETED),
-            "open": sum(1 for t in tasks if t.status == TaskStatus.OPEN),
-            "total_estimate": sum(t.estimate for t in tasks if t.estimate),
-            "completed_estimate": sum(
-                t.estimate
-                for t in tasks
-                if t.estimate and t.status == TaskStatus.COMPLETED
-            ),
-            "open_estimate": sum(
-                t.estimate for t in tasks if t.estimate and t.status == TaskStatus.OPEN
-            ),
-        }
+        # Calculate stats from filtered tasks in one pass, without a query
+        stats = task_stats(tasks)
 
         # Update status bar
         status_bar = self.query_one("#status_bar", Static)
@@ -389,32 +379,30 @@ class KairoApp(App):
         # Update stats
         stats_display = self.query_one("#stats_display", Static)
         completion_rate = 0
-        if stats["total"] > 0:
-            completion_rate = (stats["completed"] / stats["total"]) * 100
+        if stats.total > 0:
+            completion_rate = (stats.completed / stats.total) * 100
 
         # Build stats text with estimates if any exist
         stats_text = f"""[bold]Week Statistics[/bold]
 
-Total: {stats['total']}
-[green]Completed: {stats['completed']}[/green]
-[yellow]Open: {stats['open']}[/yellow]
+Total: {stats.total}
+[green]Completed: {stats.completed}[/green]
+[yellow]Open: {stats.open}[/yellow]
 Completion: {completion_rate:.0f}%"""
 
         # Add estimate totals if any tasks have estimates
-        if stats["total_estimate"] > 0:
+        if stats.total_estimate > 0:
             stats_text += f"""
 
 [bold]Estimates[/bold]
-Total: {stats['total_estimate']}h
-[green]Completed: {stats['completed_estimate']}h[/green]
-[yellow]Remaining: {stats['open_estimate']}h[/yellow]"""
+Total: {stats.total_estimate}h
+[green]Completed: {stats.completed_estimate}h[/green]
+[yellow]Remaining: {stats.open_estimate}h[/yellow]"""
 
         stats_display.update(stats_text)
 
-        # Update table
-        table = self.query_one("#task_table", DataTable)
-        table.clear()
-
+        # Build the table cells for each task
+        rows = {}
         for task in tasks:
             status_icon = "✓" if task.status == TaskStatus.COMPLETED else "○"
             status_color = "green" if task.status == TaskStatus.COMPLETED else "yellow"
@@ -422,16 +410,36 @@ Total: {stats['total_estimate']}h
             tags_display = ", ".join(task.tags) if task.tags else "-"
             estimate_display = f"{task.estimate}h" if task.estimate else "-"
 
-            table.add_row(
+            rows[str(task.id)] = (
                 str(task.id),
                 f"[{status_color}]{status_icon}[/{status_color}]",
                 task.title,
                 f"[magenta]{project_display}[/magenta]",
                 f"[cyan]{tags_display}[/cyan]",
                 f"[dim]{estimate_display}[/dim]",
-                key=str(task.id),
             )
 
+        # Update table. When the same rows are shown in the same order only
+        # the changed cells are updated, which also keeps the cursor in place;
+        # otherwise the table is rebuilt.
+        table = self.query_one("#task_table", DataTable)
+        if list(rows) == list(self._table_rows):
+            for key, cells in rows.items():
+                old_cells = self._table_rows[key]
+                if cells == old_cells:
+                    continue
+                for column_key, value, old_value in zip(
+                    self._column_keys, cells, old_cells, strict=True
+                ):
+                    if value != old_value:
+                        table.update_cell(key, column_key, value, update_width=True)
+        else:
+            table.clear()
+            for key, cells in rows.items():
+                table.add_row(*cells, key=key)
+
+        self._table_rows = rows
+
     def action_add_task(self) -> None:
         """Show add task dialog."""
 
@@ -448,7 +456,7 @@ Total: {stats['total_estimate']}h
             default_project = self.current_project_filter
 
         self.push_screen(
-            TaskFormScreen(
+            screens.TaskFormScreen(
                 self.current_year,
                 self.current_week,
                 task=None,  # None means add new task
@@ -475,7 +483,7 @@ Total: {stats['total_estimate']}h
                 self.notify(f"Task updated: {task.title}")
 
         self.push_screen(
-            TaskFormScreen(
+            screens.TaskFormScreen(
                 self.current_year,
                 self.current_week,
                 task=task,  # Pass task for editing
@@ -496,11 +504,12 @@ Total: {stats['total_estimate']}h
 
         # Toggle based on current status
         if task.status == TaskStatus.COMPLETED:
-            if self.db.reopen_task(task_id):
-                self.load_tasks()
+            outcome, _ = self.db.reopen_task(task_id)
         else:
-            if self.db.complete_task(task_id):
-                self.load_tasks()
+            outcome, _ = self.db.complete_task(task_id)
+
+        if outcome is StatusChange.CHANGED:
+            self.load_tasks()
 
     def action_toggle_schedule(self) -> None:
         """Toggle task between inbox and current week."""
@@ -514,7 +523,7 @@ Total: {stats['total_estimate']}h
             return
 
         # Toggle based on current schedule status
-        if task.week is None or task.year is None:
+        if not task.is_scheduled:
             # Task is in inbox - schedule it to current week
             self.db.update_task(task_id, week=self.current_week, year=self.current_year)
             week_str = format_week(self.current_year, self.current_week)
@@ -539,11 +548,11 @@ Total: {stats['total_estimate']}h
 
         def handle_result(confirmed: bool | None) -> None:
             if confirmed:
-                if self.db.delete_task(task_id):
+                if self.db.delete_task(task_id) is not None:
                     self.load_tasks()
                     self.notify(f"Task deleted: {task.title}")
 
-        self.push_screen(ConfirmDeleteScreen(task), handle_result)
+        self.push_screen(screens.ConfirmDeleteScreen(task), handle_result)
 
     def action_show_details(self) -> None:
         """Show task details."""
@@ -554,7 +563,7 @@ Total: {stats['total_estimate']}h
         task_id = int(table.get_row_at(table.cursor_row)[0])
         task = self.db.get_task(task_id)
         if task:
-            self.push_screen(TaskDetailScreen(task))
+            self.push_screen(screens.TaskDetailScreen(task))
 
     def action_show_filter(self) -> None:
         """Show filter selection dialog."""
@@ -576,7 +585,7 @@ Total: {stats['total_estimate']}h
                     self.current_project_filter = ""
                 self.notify("All filters cleared")
 
-        self.push_screen(FilterSelectScreen(), handle_filter_selection)
+        self.push_screen(screens.FilterSelectScreen(), handle_filter_selection)
 
     def _filter_by_tag(self) -> None:
         """Show filter by tag dialog."""
@@ -598,7 +607,9 @@ Total: {stats['total_estimate']}h
         current_filter = (
             self.inbox_tag_filter if self.viewing_inbox else self.current_tag_filter
         )
-        self.push_screen(FilterTagScreen(current_filter, available_tags), handle_result)
+        self.push_screen(
+            screens.FilterTagScreen(current_filter, available_tags), handle_result
+        )
 
     def _filter_by_project(self) -> None:
         """Show filter by project dialog."""
@@ -623,7 +634,7 @@ Total: {stats['total_estimate']}h
             else self.current_project_filter
         )
         self.push_screen(
-            FilterProjectScreen(current_filter, available_projects),
+            screens.FilterProjectScreen(current_filter, available_projects),
             handle_result,
         )
 
@@ -640,14 +651,16 @@ Total: {stats['total_estimate']}h
         """Show weekly plan for sharing with team."""
         # Get all tasks for the current week (unfiltered)
         tasks = self.db.list_tasks(week=self.current_week, year=self.current_year)
-        self.push_screen(WeeklyPlanScreen(tasks, self.current_year, self.current_week))
+        self.push_screen(
+            screens.WeeklyPlanScreen(tasks, self.current_year, self.current_week)
+        )
 
     def action_show_weekly_report(self) -> None:
         """Show comprehensive weekly report."""
         # Get all tasks for the current week (unfiltered)
         tasks = self.db.list_tasks(week=self.current_week, year=self.current_year)
         self.push_screen(
-            WeeklyReportScreen(tasks, self.current_year, self.current_week)
+            screens.WeeklyReportScreen(tasks, self.current_year, self.current_week)
         )
 
     def action_prev_week(self) -> None:
@@ -764,8 +777,10 @@ Total: {stats['total_estimate']}h
         next_year, next_week = get_next_week(self.current_year, self.current_week)
 
         # Move tasks from viewed week to next week
-        count = self.db.rollover_tasks(
-            self.current_year, self.current_week, next_year, next_week
+        count = len(
+            self.db.rollover_tasks(
+                self.current_year, self.current_week, next_year, next_week
+            )
         )
         self.load_tasks()
 
@@ -784,8 +799,10 @@ Total: {stats['total_estimate']}h
         prev_year, prev_week = iso.year, iso.week
 
         # Move tasks from viewed week to previous week
-        count = self.db.rollback_tasks(
-            self.current_year, self.current_week, prev_year, prev_week
+        count = len(
+            self.db.rollback_tasks(
+                self.current_year, self.current_week, prev_year, prev_week
+            )
         )
         self.load_tasks()
 
@@ -1,17 +1,41 @@
-"""Utility functions for date and week handling."""
+"""Utility functions for date and week handling and input parsing."""
 
+import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# Seconds for which get_current_week() reuses its last result
+_CURRENT_WEEK_TTL = 60.0
+
+# (monotonic timestamp, (year, week)) of the last get_current_week() call
+_current_week_cache: tuple[float, tuple[int, int]] | None = None
+
+# Comma plus any whitespace around it, consumed in the same match
+_TAG_SPLIT = re.compile(r"\s*,\s*")
 
 
 def get_current_week() -> tuple[int, int]:
     """Get current ISO week number and year.
 
+    The result is cached for a minute, so frequent TUI refreshes don't
+    recompute it.
+
     Returns:
         Tuple of (year, week_number)
     """
-    now = datetime.now()
-    iso = now.isocalendar()
-    return iso.year, iso.week
+    global _current_week_cache
+
+    now = time.monotonic()
+    if _current_week_cache is not None:
+        cached_at, current = _current_week_cache
+        if now - cached_at < _CURRENT_WEEK_TTL:
+            return current
+
+    iso = datetime.now().isocalendar()
+    current = iso.year, iso.week
+    _current_week_cache = (now, current)
+    return current
 
 
 def get_week_range(year: int, week: int) -> tuple[datetime, datetime]:
@@ -33,6 +57,7 @@ def get_week_range(year: int, week: int) -> tuple[datetime, datetime]:
     return week_start, week_end
 
 
+@lru_cache(maxsize=256)
 def format_week(year: int, week: int) -> str:
     """Format week for display.
 
@@ -60,16 +85,32 @@ def parse_week(week_str: str) -> tuple[int, int]:
     """
     if "-W" in week_str:
         # Format: 2025-W45
-        parts = week_str.split("-W")
-        if len(parts) != 2:
-            raise ValueError(f"Invalid week format: {week_str}")
-        return int(parts[0]), int(parts[1])
+        return _parse_full_week(week_str)
     else:
-        # Just week number, use current year
+        # Just week number, use current year (not cached, depends on today)
         current_year, _ = get_current_week()
         return current_year, int(week_str)
 
 
+@lru_cache(maxsize=256)
+def _parse_full_week(week_str: str) -> tuple[int, int]:
+    """Parse a week string in '2025-W45' format.
+
+    Args:
+        week_str: Week string to parse
+
+    Returns:
+        Tuple of (year, week_number)
+
+    Raises:
+        ValueError: If week string format is invalid
+    """
+    parts = week_str.split("-W")
+    if len(parts) != 2:
+        raise ValueError(f"Invalid week format: {week_str}")
+    return int(parts[0]), int(parts[1])
+
+
 def get_next_week(year: int, week: int) -> tuple[int, int]:
     """Get the next week.
 
@@ -86,3 +127,19 @@ def get_next_week(year: int, week: int) -> tuple[int, int]:
     next_week_date = week_end + timedelta(days=1)
     iso = next_week_date.isocalendar()
     return iso.year, iso.week
+
+
+def parse_tags(tags: str) -> list[str]:
+    """Parse a comma-separated tag list.
+
+    Args:
+        tags: Tags separated by commas (e.g., "work, urgent")
+
+    Returns:
+        Tag names with surrounding whitespace and empty entries removed
+    """
+    tags = tags.strip()
+    # Most input is a single tag, which needs no split at all
+    if "," not in tags:
+        return [tags] if tags else []
+    return [tag for tag in _TAG_SPLIT.split(tags) if tag]
@@ -0,0 +1,339 @@
+"""Tests for the SQLite database layer."""
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from kairo.database import (
+    _MAX_ROLLOVER_MOVES,
+    _SCHEMA_VERSION,
+    Database,
+    StatusChange,
+)
+from kairo.models import TaskStatus
+
+# Schema as created by releases before the timestamp, position and
+# WITHOUT ROWID migrations: ISO text timestamps, no position column, a rowid
+# task_tags table and no migrations marker table
+_LEGACY_SCHEMA = """
+CREATE TABLE tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'open',
+    week INTEGER,
+    year INTEGER,
+    created_at TEXT NOT NULL,
+    completed_at TEXT,
+    estimate INTEGER,
+    project TEXT
+);
+CREATE TABLE tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE task_tags (
+    task_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (task_id, tag_id),
+    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+    FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
+);
+INSERT INTO tasks
+    (title, description, status, week, year, created_at, completed_at,
+     estimate, project)
+VALUES
+    ('Later', 'notes', 'open', 42, 2026, '2026-10-12T10:00:00.123456', NULL,
+     3, 'kairo'),
+    ('Earlier', '', 'completed', 42, 2026, '2026-10-11T09:00:00',
+     '2026-10-13T17:30:00', 2, NULL),
+    ('Other week', '', 'open', 41, 2026, '2026-10-05T09:00:00', NULL,
+     NULL, NULL),
+    ('Inbox second', '', 'open', NULL, NULL, '2026-10-02T08:00:00', NULL,
+     NULL, NULL),
+    ('Inbox first', '', 'open', NULL, NULL, '2026-10-01T08:00:00', NULL,
+     NULL, NULL);
+INSERT INTO tags (name) VALUES ('work'), ('home');
+INSERT INTO task_tags (task_id, tag_id) VALUES (1, 1), (1, 2), (3, 2);
+"""
+
+
+class AddTaskTests(unittest.TestCase):
+    """Tests for Database.add_task()."""
+
+    def setUp(self):
+        self.db = Database(Path(":memory:"))
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_duplicate_tags_are_dropped_from_returned_task(self):
+        task = self.db.add_task("Task", tags=["a", "a"])
+
+        self.assertEqual(task.tags, ["a"])
+        self.assertEqual(task.tags, self.db.get_task(task.id).tags)
+
+    def test_returned_tags_keep_given_order(self):
+        task = self.db.add_task("Task", tags=["b", "a", "b"])
+
+        self.assertEqual(task.tags, ["b", "a"])
+
+
+class UpdateTaskTests(unittest.TestCase):
+    """Tests for Database.update_task()."""
+
+    def setUp(self):
+        self.db = Database(Path(":memory:"))
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_missing_task_with_tags_returns_false(self):
+        self.assertFalse(self.db.update_task(999, tags=["work"]))
+        self.assertEqual(self.db.get_all_tags(), [])
+
+    def test_missing_task_with_fields_and_tags_returns_false(self):
+        self.assertFalse(self.db.update_task(999, title="New", tags=["work"]))
+        self.assertEqual(self.db.get_all_tags(), [])
+
+    def test_existing_task_tags_only(self):
+        task = self.db.add_task("Task", tags=["old"])
+
+        self.assertTrue(self.db.update_task(task.id, tags=["new", "other"]))
+        self.assertEqual(self.db.get_task(task.id).tags, ["new", "other"])
+
+
+class TransactionTests(unittest.TestCase):
+    """Tests for Database.transaction()."""
+
+    def setUp(self):
+        self.db = Database(Path(":memory:"))
+
+    def tearDown(self):
+        self.db.close()
+
+    def _transaction_statements(self) -> list[str]:
+        """Record BEGIN/COMMIT/ROLLBACK statements run on the connection."""
+        statements = []
+
+        def record(sql):
+            if sql.split()[0] in ("BEGIN", "COMMIT", "ROLLBACK"):
+                statements.append(sql)
+
+        self.db.conn.set_trace_callback(record)
+        return statements
+
+    def test_inner_exception_rolls_back_outer_block(self):
+        with self.assertRaises(RuntimeError), self.db.transaction():
+            self.db.add_task("Outer", schedule=False)
+            with self.db.transaction():
+                self.db.add_task("Inner", schedule=False)
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.db.list_inbox_tasks(), [])
+        self.assertFalse(self.db.conn.in_transaction)
+
+    def test_nested_blocks_commit_once(self):
+        statements = self._transaction_statements()
+
+        with self.db.transaction():
+            self.db.add_task("First", schedule=False)
+            with self.db.transaction():
+                self.db.add_task("Second", schedule=False)
+            self.assertTrue(self.db.conn.in_transaction)
+
+        self.assertEqual(statements, ["BEGIN IMMEDIATE", "COMMIT"])
+        self.assertEqual(len(self.db.list_inbox_tasks()), 2)
+
+    def test_write_lock_taken_at_begin(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tasks.db"
+            db = Database(path)
+            other = sqlite3.connect(path, timeout=0)
+            try:
+                # Nothing is written inside, but the lock is already held
+                with db.transaction(), self.assertRaises(sqlite3.OperationalError):
+                    other.execute("BEGIN IMMEDIATE")
+            finally:
+                other.close()
+                db.close()
+
+
+class StatusChangeTests(unittest.TestCase):
+    """Tests for the outcomes of status changes, deletes and rollovers."""
+
+    def setUp(self):
+        self.db = Database(Path(":memory:"))
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_complete_task(self):
+        task = self.db.add_task("Task")
+
+        self.assertEqual(self.db.complete_task(task.id), (StatusChange.CHANGED, "Task"))
+        self.assertEqual(
+            self.db.complete_task(task.id), (StatusChange.UNCHANGED, "Task")
+        )
+        self.assertEqual(self.db.complete_task(999), (StatusChange.NOT_FOUND, None))
+        self.assertEqual(self.db.get_task(task.id).status, TaskStatus.COMPLETED)
+
+    def test_reopen_task(self):
+        task = self.db.add_task("Task")
+
+        self.assertEqual(self.db.reopen_task(task.id), (StatusChange.UNCHANGED, "Task"))
+        self.db.complete_task(task.id)
+        self.assertEqual(self.db.reopen_task(task.id), (StatusChange.CHANGED, "Task"))
+        self.assertEqual(self.db.reopen_task(999), (StatusChange.NOT_FOUND, None))
+        task = self.db.get_task(task.id)
+        self.assertEqual(task.status, TaskStatus.OPEN)
+        self.assertIsNone(task.completed_at)
+
+    def test_delete_task_returns_title(self):
+        task = self.db.add_task("Task", tags=["work"])
+
+        self.assertEqual(self.db.delete_task(task.id), "Task")
+        self.assertIsNone(self.db.get_task(task.id))
+        self.assertIsNone(self.db.delete_task(task.id))
+
+    def test_rollover_returns_moved_tasks(self):
+        first = self.db.add_task("First", week=1, year=2020)
+        second = self.db.add_task("Second", week=1, year=2020)
+        done = self.db.add_task("Done", week=1, year=2020)
+        self.db.complete_task(done.id)
+
+        moved = self.db.rollover_tasks(2020, 1, 2020, 2)
+
+        self.assertEqual(sorted(moved), [(first.id, "First"), (second.id, "Second")])
+        self.assertEqual(self.db.get_task(done.id).week, 1)
+        self.assertEqual(self.db.rollover_tasks(2020, 1, 2020, 2), [])
+
+
+class RolloverManyTests(unittest.TestCase):
+    """Tests for Database.rollover_many()."""
+
+    def setUp(self):
+        self.db = Database(Path(":memory:"))
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_moves_do_not_chain(self):
+        task = self.db.add_task("Task", week=1, year=2020)
+
+        moved = self.db.rollover_many([(2020, 1, 2020, 2), (2020, 2, 2020, 3)])
+
+        self.assertEqual(moved, [(task.id, "Task")])
+        self.assertEqual(self.db.get_task(task.id).week, 2)
+
+    def test_moves_do_not_chain_at_limit(self):
+        # The chained pair sits at both ends of a full batch
+        task = self.db.add_task("Task", week=1, year=2020)
+        moves = [(2020, 1, 2020, 2)]
+        moves += [(year, 1, year, 2) for year in range(1, _MAX_ROLLOVER_MOVES - 1)]
+        moves.append((2020, 2, 2020, 3))
+        self.assertEqual(len(moves), _MAX_ROLLOVER_MOVES)
+
+        self.db.rollover_many(moves)
+
+        self.assertEqual(self.db.get_task(task.id).week, 2)
+
+    def test_more_moves_than_limit_raises_without_moving(self):
+        # One move past the limit, with the chained pair at both ends
+        task = self.db.add_task("Task", week=1, year=2020)
+        moves = [(2020, 1, 2020, 2)]
+        moves += [(year, 1, year, 2) for year in range(1, _MAX_ROLLOVER_MOVES)]
+        moves.append((2020, 2, 2020, 3))
+
+        with self.assertRaises(ValueError):
+            self.db.rollover_many(moves)
+        self.assertEqual(self.db.get_task(task.id).week, 1)
+
+
+class LegacyMigrationTests(unittest.TestCase):
+    """Tests for opening a database created by an older release."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "tasks.db"
+        conn = sqlite3.connect(self.path)
+        conn.executescript(_LEGACY_SCHEMA)
+        conn.close()
+        self.db = Database(self.path)
+
+    def tearDown(self):
+        self.db.close()
+        self._tmp.cleanup()
+
+    def test_values_survive(self):
+        task = self.db.get_task(1)
+
+        self.assertEqual(task.title, "Later")
+        self.assertEqual(task.description, "notes")
+        self.assertEqual(task.status, TaskStatus.OPEN)
+        self.assertEqual((task.week, task.year), (42, 2026))
+        self.assertEqual(task.estimate, 3)
+        self.assertEqual(task.project, "kairo")
+
+    def test_timestamps_become_local_unix_times(self):
+        # Naive ISO strings were local times; fractional seconds are dropped
+        later = self.db.get_task(1)
+        earlier = self.db.get_task(2)
+
+        self.assertEqual(later.created_at, datetime(2026, 10, 12, 10, 0, 0))
+        self.assertIsNone(later.completed_at)
+        self.assertEqual(earlier.completed_at, datetime(2026, 10, 13, 17, 30, 0))
+        row = self.db.conn.execute(
+            "SELECT typeof(created_at), typeof(completed_at) FROM tasks WHERE id = 2"
+        ).fetchone()
+        self.assertEqual(tuple(row), ("integer", "integer"))
+
+    def test_tag_links_survive(self):
+        self.assertEqual(self.db.get_task(1).tags, ["home", "work"])
+        self.assertEqual(self.db.get_task(2).tags, [])
+        self.assertEqual(self.db.get_task(3).tags, ["home"])
+        self.assertEqual(
+            [task.id for task in self.db.list_tasks_by_tag("home", show_all=True)],
+            [3, 1],
+        )
+
+    def test_task_tags_rebuilt_without_rowid(self):
+        sql = self.db.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'task_tags'"
+        ).fetchone()[0]
+
+        self.assertIn("WITHOUT ROWID", sql.upper())
+
+    def test_positions_follow_created_at_within_each_week(self):
+        positions = {
+            task.title: task.position
+            for task in self.db.list_tasks(show_all=True) + self.db.list_inbox_tasks()
+        }
+
+        self.assertEqual(
+            positions,
+            {
+                "Earlier": 1,
+                "Later": 2,
+                "Other week": 1,
+                "Inbox first": 1,
+                "Inbox second": 2,
+            },
+        )
+
+    def test_reopening_keeps_migrated_data(self):
+        self.db.close()
+        Database._initialized_paths.discard(self.path)
+        self.db = Database(self.path)
+
+        version = self.db.conn.execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, _SCHEMA_VERSION)
+        self.assertEqual(self.db.get_task(1).created_at, datetime(2026, 10, 12, 10))
+        self.assertEqual(self.db.get_task(1).tags, ["home", "work"])
+        self.assertEqual(self.db.get_task(1).position, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()